@@ -1,13 +1,39 @@
+import sys
 from argparse import ArgumentParser, Namespace
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
+from src.backends import BACKENDS, LineBackend
+from src.differential import compare_backends, generate_synthetic_project, print_comparison
+from src.libraries import DEFAULT_CACHE_PATH
 from src.parser import Parser
+from src.server import ImportGraphIndex, serve
+from src.utils import MemoryLimitError
 
 parser = ArgumentParser()
 parser.add_argument('project_path', help='Path to introspected project')
 parser.add_argument(
     '-igpath', '--import-graph-path', help='Path to created file with import graph (in html)'
 )
+parser.add_argument(
+    '-ihpath', '--inheritance-graph-path',
+    help='Path to created file with class inheritance graph (in html)'
+)
+parser.add_argument(
+    '-it', '--import-time-entry',
+    help='Entry module (main.py or pkg.cli) to import with `python -X importtime`: '
+         'the most expensive imports are ranked and the import graph is coloured by cost'
+)
+parser.add_argument(
+    '-cov', '--coverage-file', type=Path,
+    help='Path to `.coverage` database: the least covered objects are reported '
+         'and graphs are coloured by coverage'
+)
+parser.add_argument(
+    '--distributions-cache', type=Path, default=DEFAULT_CACHE_PATH,
+    help='Path to the cached index of installed distributions used to tell stdlib, '
+         'third-party and missing imports apart'
+)
 parser.add_argument(
     '-gw', '--graph-width', help='Width of the created graph', default=1600, type=int
 )
@@ -15,20 +41,138 @@ parser.add_argument(
     '-gh', '--graph-height', help='Height of the created graph', default=1000, type=int
 )
 
+parser.add_argument(
+    '--summary-only', action='store_true',
+    help='Low-memory mode: release parsed lines of every module right after reading, '
+         'only imports and classes hierarchy are linked'
+)
+parser.add_argument(
+    '--memory-limit', type=float, help='Abort when peak RSS goes over the limit (in MB)'
+)
+parser.add_argument(
+    '--backend', choices=list(BACKENDS), default=LineBackend.name,
+    help='Parsing engine: hand-written line heuristics or stdlib ast/tokenize'
+)
+
+commands = parser.add_subparsers(dest='command')
+
+dead_code_parser = commands.add_parser(
+    'dead-code', help='Report modules, classes, functions and globals unreachable from entry points'
+)
+dead_code_parser.add_argument(
+    '-e', '--entry', nargs='+', required=True,
+    help='Entry modules as paths relative to the project (main.py) or import paths (pkg.cli)'
+)
+dead_code_parser.add_argument(
+    '--strict', action='store_true', help='Exit with code 1 if any dead code is found'
+)
+
+serve_parser = commands.add_parser(
+    'serve', help='Run local HTTP server which serves the import graph by parts'
+)
+serve_parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on')
+serve_parser.add_argument('--port', default=8000, type=int, help='Port to listen on')
+serve_parser.add_argument(
+    '--cache', help='Path to the import graph cache: loaded if it was made for the same project '
+         'and modules were not changed since, otherwise created'
+)
+
+compare_parser = commands.add_parser(
+    'compare-backends', help='Compare speed, memory and extracted objects of the parsing backends'
+)
+compare_parser.add_argument(
+    '--synthetic-modules', type=int, default=0,
+    help='Also compare on generated project with this amount of modules'
+)
+
 args: Namespace = parser.parse_args()
 
+if args.summary_only and args.command == 'dead-code':
+    parser.error('dead-code needs functions bodies, it can not run with --summary-only')
+
+if args.summary_only and args.coverage_file:
+    parser.error('coverage is joined onto modules content, it can not run with --summary-only')
+
+if args.import_graph_path and args.import_time_entry and args.coverage_file:
+    parser.error('import graph is coloured either by import time or by coverage, drop one of them')
+
 if __name__ == '__main__':
     project = Path(args.project_path)
-    parser = Parser(project)
 
-    parser.gather_objects()
-    parser.build_link_list()
+    if args.command == 'compare-backends':
+        print_comparison(project, compare_backends(project))
+
+        if args.synthetic_modules:
+            with TemporaryDirectory() as synthetic_dir:
+                synthetic = generate_synthetic_project(Path(synthetic_dir), args.synthetic_modules)
+                print_comparison(synthetic, compare_backends(synthetic))
+
+        sys.exit()
+
+    if args.command == 'serve' and args.cache:
+        cached_index = ImportGraphIndex.load(Path(args.cache), project)
+        if cached_index is not None:
+            serve(cached_index, host=args.host, port=args.port)
+            sys.exit()
+
+    project_parser = Parser(
+        project,
+        summary_only=args.summary_only,
+        memory_limit=args.memory_limit,
+        backend=args.backend,
+    )
+
+    try:
+        project_parser.gather_objects()
+        project_parser.build_link_list()
+    except MemoryLimitError as err:
+        sys.exit(f'Aborted: {err}')
+    project_parser.classify_imports(args.distributions_cache)
+
+    if args.import_time_entry:
+        try:
+            project_parser.linker.find_entry_module(args.import_time_entry)
+        except KeyError as err:
+            parser.error(err.args[0])
+
+        try:
+            project_parser.measure_import_cost(args.import_time_entry).print_ranking()
+        except RuntimeError as err:
+            sys.exit(f'Aborted: {err}')
+
+    if args.coverage_file:
+        project_parser.load_coverage(args.coverage_file).print_report()
 
     if args.import_graph_path:
-        parser.get_import_graph(
+        project_parser.get_import_graph(
             args.import_graph_path,
             width=args.graph_width,
             height=args.graph_height,
         )
 
-    parser.print_stats()
+    if args.inheritance_graph_path:
+        project_parser.get_inheritance_graph(
+            args.inheritance_graph_path,
+            width=args.graph_width,
+            height=args.graph_height,
+        )
+
+    if args.command == 'dead-code':
+        for entry in args.entry:
+            try:
+                project_parser.linker.find_entry_module(entry)
+            except KeyError as err:
+                parser.error(err.args[0])
+
+        dead_code_amount = project_parser.print_dead_code(args.entry)
+
+        if args.strict and dead_code_amount:
+            sys.exit(1)
+    elif args.command == 'serve':
+        index = ImportGraphIndex.from_linker(project_parser.linker)
+        if args.cache:
+            index.save(Path(args.cache), project)
+
+        serve(index, host=args.host, port=args.port)
+    else:
+        project_parser.print_stats()
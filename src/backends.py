@@ -0,0 +1,252 @@
+import ast
+import io
+import tokenize
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+from src.builder import ModuleBuilder
+from src.code_objs.classes import Class
+from src.code_objs.functions import Function
+from src.code_objs.line import (
+    ClassLine, CodeLine, CommentLine, EmptyLine, FunctionLine, ImportLine, LineType, VariableLine,
+    parse_objects_from_file
+)
+from src.code_objs.variables import Variable
+from src.notebooks import NOTEBOOK_SUFFIX, iter_notebook_lines
+
+if TYPE_CHECKING:
+    from src.tree import Module
+
+
+def iter_source_lines(path: Path) -> Iterator[str]:
+    """ Lines of python module or code cells of jupyter notebook """
+    if path.suffix == NOTEBOOK_SUFFIX:
+        yield from iter_notebook_lines(path)
+        return
+
+    with path.open(encoding='utf-8') as i_file:
+        yield from i_file
+
+
+class ParsingBackend(ABC):
+    """ Engine which turns a module file into `CodeLine`/`LineType` content and then into
+        `ImportLine`, `Class`, `Function` and `Variable` objects of the `Module`
+    """
+    name: str
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}>'
+
+    @abstractmethod
+    def read(self, path: Path) -> list[CodeLine | LineType]:
+        """ Module content: one object per logical line with line numbers """
+
+    @abstractmethod
+    def parse(self, module: 'Module'):
+        """ Fill module imports, global variables, classes and functions from its content """
+
+
+class LineBackend(ParsingBackend):
+    """ Hand-written line heuristics from `src.code_objs.line` """
+    name = 'line'
+
+    def read(self, path: Path) -> list[CodeLine | LineType]:
+        content = []
+        lineno = 1
+        source_lines = iter_source_lines(path)
+        while True:
+            code_line = parse_objects_from_file(source_lines)
+
+            if code_line is None:
+                break
+
+            getattr(code_line, 'code_line', code_line).lineno = lineno
+            lineno += getattr(code_line, 'code_line', code_line).lines_amount
+
+            content.append(code_line)
+
+        return content
+
+    def parse(self, module: 'Module'):
+        ModuleBuilder(module).build()
+
+
+class AstBackend(ParsingBackend):
+    """ Stdlib engine: `tokenize` splits logical lines, `ast` classifies them and gives
+        exact definitions spans. Modules which `ast` can't parse (python 2, templates)
+        fall back to the line engine.
+    """
+    name = 'ast'
+
+    def __init__(self):
+        # Module path -> top level definitions outline, kept between `read` and `parse`
+        self._outlines: dict[Path, list | None] = {}
+        self._fallback = LineBackend()
+
+    def read(self, path: Path) -> list[CodeLine | LineType]:
+        source = ''.join(iter_source_lines(path))
+
+        try:
+            tree = ast.parse(source)
+            content = self._logical_lines(source, tree)
+        except (SyntaxError, tokenize.TokenError):
+            self._outlines[path] = None
+            return self._fallback.read(path)
+
+        self._outlines[path] = sorted(
+            [outline for outline in map(self._outline_variable, tree.body) if outline is not None]
+            + [self._outline(node) for node in self._iter_definitions(tree)],
+            key=lambda outline: outline[2]
+        )
+        return content
+
+    def parse(self, module: 'Module'):
+        outline = self._outlines.pop(module.path, None)
+        if outline is None:
+            self._fallback.parse(module)
+            return
+
+        content = module.content
+        linenos = [getattr(line, 'code_line', line).lineno for line in content]
+        by_lineno = dict(zip(linenos, content))
+
+        def make(cls, name, path, lineno, end_lineno):
+            obj = cls(name, path, content[bisect_right(linenos, lineno):bisect_right(linenos, end_lineno)])
+            obj.definition = by_lineno[lineno]
+            obj.span = (lineno, end_lineno)
+            return obj
+
+        module.imports = [line for line in content if isinstance(line, ImportLine)]
+
+        def build(outline_, path):
+            kind, name, lineno, end_lineno, extra = outline_
+            if kind == 'function':
+                obj = make(Function, name, path, lineno, end_lineno)
+                nested = extra
+            else:
+                bases, methods, nested = extra
+                obj = make(Class, name, path, lineno, end_lineno)
+                obj.bases = bases
+                obj.set_methods([build(method, obj.path) for method in methods])
+
+            obj.nested = [build(child, obj.path) for child in nested]
+            return obj
+
+        for kind, name, lineno, end_lineno, extra in outline:
+            if kind == 'variable':
+                variable = Variable(name, module.abs_import, [by_lineno[lineno]])
+                variable.span = (lineno, end_lineno)
+                module.global_variables.append(variable)
+            elif kind == 'function':
+                module.functions.append(build((kind, name, lineno, end_lineno, extra), module.abs_import))
+            else:
+                module.classes.append(build((kind, name, lineno, end_lineno, extra), module.abs_import))
+
+    @staticmethod
+    def _iter_definitions(node: ast.AST):
+        """ Functions and classes whose closest enclosing definition is the node,
+            compound statements (`if`, `try`, `with`) are looked through
+        """
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                yield child
+            elif isinstance(child, (ast.stmt, ast.excepthandler, ast.match_case)):
+                yield from AstBackend._iter_definitions(child)
+
+    @classmethod
+    def _outline(cls, node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef) -> tuple:
+        """ (kind, name, lineno, end lineno, extra) of the definition with its nested ones:
+            functions right in a class are its methods, other definitions are nested
+        """
+        definitions = [cls._outline(child) for child in cls._iter_definitions(node)]
+
+        if not isinstance(node, ast.ClassDef):
+            return 'function', node.name, node.lineno, node.end_lineno, definitions
+
+        bases = [
+            ast.unparse(base.value if isinstance(base, ast.Subscript) else base)
+            for base in node.bases
+        ]
+        methods = [outline for outline in definitions if outline[0] == 'function']
+        nested = [outline for outline in definitions if outline[0] == 'class']
+        return 'class', node.name, node.lineno, node.end_lineno, (bases, methods, nested)
+
+    @staticmethod
+    def _outline_variable(node: ast.stmt) -> tuple | None:
+        """ (kind, name, lineno, end lineno, extra) of the module level assignment """
+        if isinstance(node, (ast.Assign, ast.AnnAssign)):
+            target = node.targets[0] if isinstance(node, ast.Assign) else node.target
+            if isinstance(node, ast.AnnAssign) and node.value is None:
+                return None
+            return 'variable', ast.unparse(target), node.lineno, node.end_lineno, None
+
+        return None
+
+    @staticmethod
+    def _logical_lines(source: str, tree: ast.Module) -> list[CodeLine | LineType]:
+        """ Content in the same shape the line engine produces, classified by `ast` nodes
+            starting at the first token of every logical line
+        """
+        kinds = {}
+        imports = {}
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.stmt):
+                continue
+
+            key = (node.lineno, node.col_offset)
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                kinds[key] = ImportLine
+                imports[key] = ast.unparse(node)
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                # Decorators are separate logical lines, `def` is on `node.lineno`
+                kinds[key] = FunctionLine
+            elif isinstance(node, ast.ClassDef):
+                kinds[key] = ClassLine
+            elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+                kinds[key] = VariableLine
+
+        lines = source.splitlines()
+        content = []
+        start = None
+        for token in tokenize.generate_tokens(io.StringIO(source).readline):
+            if token.type in (tokenize.ENCODING, tokenize.INDENT, tokenize.DEDENT, tokenize.ENDMARKER):
+                continue
+
+            if start is None:
+                if token.type == tokenize.COMMENT:
+                    continue
+                if token.type == tokenize.NL:
+                    # Blank or comment only physical line
+                    code_line = CodeLine(lines[token.start[0] - 1] if token.start[0] <= len(lines) else '')
+                    code_line.lineno = token.start[0]
+                    content.append(CommentLine(code_line) if code_line.is_comment() else EmptyLine(code_line))
+                    continue
+                start = token.start
+
+            if token.type != tokenize.NEWLINE:
+                continue
+
+            row, col = start
+            end_row = token.start[0]
+            start = None
+
+            kind = kinds.get((row, col))
+            if kind is ImportLine:
+                text = ' ' * col + imports[row, col]
+            else:
+                text = ' '.join(line.rstrip('\\') for line in lines[row - 1:end_row])
+
+            code_line = CodeLine(text)
+            code_line.lineno = row
+            code_line.lines_amount = end_row - row + 1
+            content.append(kind(code_line) if kind is not None else code_line)
+
+        return content
+
+
+BACKENDS: dict[str, type[ParsingBackend]] = {
+    LineBackend.name: LineBackend,
+    AstBackend.name: AstBackend,
+}
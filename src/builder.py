@@ -0,0 +1,108 @@
+from collections import namedtuple
+from typing import TYPE_CHECKING
+
+from src.code_objs.classes import Class
+from src.code_objs.functions import Function
+from src.code_objs.line import ClassLine, CommentLine, EmptyLine, FunctionLine, ImportLine, VariableLine
+from src.code_objs.variables import Variable
+
+if TYPE_CHECKING:
+    from src.tree import Module
+
+# Opened definition: its indent, index of the definition line in content,
+# the object and functions defined right in its body (methods for classes)
+Block = namedtuple('Block', 'indent start obj functions')
+
+
+# `LineType` is ABC, so `isinstance` checks are slow: the pass dispatches on exact types
+SKIPPED_LINES = frozenset((EmptyLine, CommentLine))
+DEFINITION_KEYWORDS = {
+    FunctionLine: (('def ', 'async def '), Function),
+    ClassLine: (('class ',), Class),
+}
+
+
+def definition_class(line) -> type[Class] | type[Function] | None:
+    """ Line heuristics match `class`/`def` tokens anywhere in the line,
+        the definition must start with the keyword
+    """
+    try:
+        keywords, obj_class = DEFINITION_KEYWORDS[type(line)]
+    except KeyError:
+        return None
+
+    return obj_class if line.code_line.data.lstrip().startswith(keywords) else None
+
+
+class ModuleBuilder:
+    """ Builds imports, global variables, classes with methods, functions and nested
+        definitions of the module in one pass over its content. Opened definitions are
+        kept on the indentation stack and closed by the first code line which is not
+        indented deeper, their bodies are slices of the content.
+    """
+
+    def __init__(self, module: 'Module'):
+        self.module = module
+
+    def build(self):
+        content = self.module.content
+        stack: list[Block] = []
+
+        for idx, line in enumerate(content):
+            line_type = type(line)
+            if line_type in SKIPPED_LINES:
+                continue
+
+            indent = line.indent
+            while stack and stack[-1].indent >= indent:
+                self._close(stack.pop(), idx)
+
+            if line_type is ImportLine:
+                self.module.imports.append(line)
+            elif line_type is VariableLine:
+                # `@decorator(key=value)` looks like an assignment to the line heuristics
+                if not stack and indent == 0 and not line.code_line.data.startswith('@'):
+                    self._add_global_variable(line)
+            else:
+                obj_class = definition_class(line)
+                if obj_class is not None:
+                    stack.append(self._open(obj_class, line, idx, stack[-1] if stack else None))
+
+        while stack:
+            self._close(stack.pop(), len(content))
+
+    def _add_global_variable(self, line: VariableLine):
+        variable = Variable(
+            name=Variable.parse_name(line),
+            module_import_path=self.module.abs_import,
+            body=[line]
+        )
+        variable.span = (line.lineno, line.end_lineno)
+        self.module.global_variables.append(variable)
+
+    def _open(self, obj_class: type[Class] | type[Function], line, idx: int, parent: Block | None) -> Block:
+        obj = obj_class(
+            obj_class.parse_name(line),
+            parent.obj.path if parent else self.module.abs_import,
+            []
+        )
+        obj.definition = line
+
+        if obj_class is Class:
+            obj.bases = Class.parse_bases(line)
+
+        if parent is None:
+            (self.module.classes if obj_class is Class else self.module.functions).append(obj)
+        elif obj_class is Function and type(parent.obj) is Class:
+            parent.functions.append(obj)
+        else:
+            parent.obj.nested.append(obj)
+
+        return Block(line.indent, idx, obj, [])
+
+    def _close(self, block: Block, end: int):
+        block.obj.body = self.module.content[block.start + 1:end]
+        block.obj.calculate_span()
+
+        if type(block.obj) is Class:
+            block.obj.set_methods(block.functions)
@@ -0,0 +1,228 @@
+import re
+from array import array
+from keyword import iskeyword
+from typing import Iterable
+
+from src.code_objs.classes import Class
+from src.code_objs.functions import Function
+from src.code_objs.line import ClassLine, CommentLine, EmptyLine, FunctionLine, ImportLine, VariableLine
+from src.code_objs.variables import Variable
+from src.hierarchy import ClassHierarchy
+from src.linker import Linker
+from src.tree import Module
+
+Callee = Function | Class
+
+STRINGS_RE = re.compile(r'("""|\'\'\').*?\1|"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'')
+CALL_RE = re.compile(r'(?<![\w.)\]])([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)\s*\(')
+PARAMS_RE = re.compile(r'[(,]\s*\**([A-Za-z_]\w*)')
+
+# Marker of the name which is known to be unresolvable in the scope
+UNRESOLVED = -1
+
+
+def iter_call_names(body: Iterable) -> Iterable[str]:
+    """ Yields dotted names of all call sites in the body lines (`a.b(` -> `a.b`) """
+    for line in body:
+        if isinstance(line, (EmptyLine, CommentLine, ImportLine, FunctionLine, ClassLine)):
+            continue
+
+        code_line = getattr(line, 'code_line', line).data
+        code_line = STRINGS_RE.sub('""', code_line).split('#', maxsplit=1)[0]
+
+        for name in CALL_RE.findall(code_line):
+            if not iskeyword(name.split('.', maxsplit=1)[0]):
+                yield name
+
+
+def local_names(function: Function) -> set[str]:
+    """ Names which shadow module globals inside the function: arguments,
+        assigned variables and nested definitions
+    """
+    names = set()
+
+    if function.definition is not None:
+        header = function.definition.code_line.data
+        names.update(PARAMS_RE.findall(header[header.find('('):]))
+
+    for line in function.body:
+        if isinstance(line, VariableLine):
+            names.update(
+                name.strip(' ()*') for name in Variable.parse_name(line).split(',')
+            )
+        elif isinstance(line, FunctionLine):
+            names.add(Function.parse_name(line))
+        elif isinstance(line, ClassLine):
+            names.add(Class.parse_name(line))
+
+    return names
+
+
+class CallGraph:
+    """ Static call graph between project functions, methods and classes (as constructors).
+        Nodes are integer ids over `self.nodes`, edges are kept as parallel arrays and
+        converted into CSR form (`out_offsets`/`out_targets`) after the build.
+    """
+
+    def __init__(self, linker: Linker, hierarchy: ClassHierarchy):
+        self.linker = linker
+        self.hierarchy = hierarchy
+
+        self.nodes: list[Callee] = []
+        self.node_ids: dict[Callee, int] = {}
+        self.owners: dict[Function, Class] = {}
+
+        self.call_sites = 0
+        self.unresolved_call_sites = 0
+
+        self.out_offsets = array('L', [0])
+        self.out_targets = array('L')
+        self.in_degree = array('L')
+
+        # (scope, dotted name) -> node id or UNRESOLVED
+        self._resolved: dict[tuple[str, str], int] = {}
+
+    def __repr__(self):
+        return f'<CallGraph {len(self.nodes)} nodes, {len(self.out_targets)} edges>'
+
+    def _add_node(self, callee: Callee) -> int:
+        self.node_ids[callee] = len(self.nodes)
+        self.nodes.append(callee)
+        return self.node_ids[callee]
+
+    def iter_callables(self) -> Iterable[tuple[Module, Function]]:
+        for module_data in self.linker.values():
+            module = module_data['module']
+
+            for function in module.functions:
+                yield module, function
+
+            for class_ in module.classes:
+                for method in class_.methods + class_.magic_methods:
+                    self.owners[method] = class_
+                    yield module, method
+
+    def build(self):
+        """ Extract call sites of every function and method and link them to definitions """
+        callables = list(self.iter_callables())
+
+        for module_data in self.linker.values():
+            for class_ in module_data['module'].classes:
+                self._add_node(class_)
+
+        for _, function in callables:
+            self._add_node(function)
+
+        callers = array('L')
+        callees = array('L')
+        for module, function in callables:
+            caller_id = self.node_ids[function]
+            shadowed = local_names(function)
+
+            targets = set()
+            for name in iter_call_names(function.body):
+                self.call_sites += 1
+                head = name.split('.', maxsplit=1)[0]
+                if head in shadowed and head not in ('self', 'cls'):
+                    self.unresolved_call_sites += 1
+                    continue
+
+                callee_id = self.resolve_call(module, function, name)
+                if callee_id == UNRESOLVED:
+                    self.unresolved_call_sites += 1
+                else:
+                    targets.add(callee_id)
+
+            for callee_id in sorted(targets):
+                callers.append(caller_id)
+                callees.append(callee_id)
+
+        self._compact(callers, callees)
+
+    def _compact(self, callers: array, callees: array):
+        """ Edges are appended grouped by the caller, so offsets are one counting pass """
+        counts = array('L', [0]) * len(self.nodes)
+        self.in_degree = array('L', [0]) * len(self.nodes)
+
+        for caller_id, callee_id in zip(callers, callees):
+            counts[caller_id] += 1
+            self.in_degree[callee_id] += 1
+
+        self.out_offsets = array('L', [0]) * (len(self.nodes) + 1)
+        for node_id, count in enumerate(counts):
+            self.out_offsets[node_id + 1] = self.out_offsets[node_id] + count
+
+        self.out_targets = array('L', [0]) * len(callees)
+        cursor = array('L', self.out_offsets[:-1])
+        for caller_id, callee_id in zip(callers, callees):
+            self.out_targets[cursor[caller_id]] = callee_id
+            cursor[caller_id] += 1
+
+    def resolve_call(self, module: Module, function: Function, name: str) -> int:
+        """ Node id of the called object or `UNRESOLVED`.
+            `self.`/`cls.` calls are resolved through the owner class MRO,
+            other names through module globals and imports. Cached per (scope, name).
+        """
+        head, _, rest = name.partition('.')
+        owner = self.owners.get(function)
+        is_method_call = head in ('self', 'cls') and owner is not None
+
+        if is_method_call:
+            if not rest or '.' in rest:
+                return UNRESOLVED
+            key = (owner.path, rest)
+        else:
+            key = (module.abs_import, name)
+
+        try:
+            return self._resolved[key]
+        except KeyError:
+            pass
+
+        if is_method_call:
+            callee = self.find_method(owner, rest)
+        else:
+            callee = self._resolve_global(module, name)
+
+        self._resolved[key] = self.node_ids.get(callee, UNRESOLVED)
+        return self._resolved[key]
+
+    def _resolve_global(self, module: Module, name: str) -> Callee | None:
+        resolved = self.linker.resolve_name(module, name)
+        if isinstance(resolved, (Function, Class)):
+            return resolved
+
+        # `ClassName.method(` -- the class is resolvable, the attribute is its method
+        if resolved is None and '.' in name:
+            class_name, method_name = name.rsplit('.', maxsplit=1)
+            class_ = self.linker.resolve_name(module, class_name)
+            if isinstance(class_, Class):
+                return self.find_method(class_, method_name)
+
+        return None
+
+    def find_method(self, class_: Class, name: str) -> Function | None:
+        for mro_class in self.hierarchy.mro(class_):
+            for method in mro_class.methods + mro_class.magic_methods:
+                if method.name == name:
+                    return method
+
+        return None
+
+    def callees(self, callee: Callee) -> list[Callee]:
+        node_id = self.node_ids[callee]
+        return [
+            self.nodes[target_id]
+            for target_id in self.out_targets[self.out_offsets[node_id]:self.out_offsets[node_id + 1]]
+        ]
+
+    def fan_out(self, callee: Callee) -> int:
+        node_id = self.node_ids[callee]
+        return self.out_offsets[node_id + 1] - self.out_offsets[node_id]
+
+    def fan_in(self, callee: Callee) -> int:
+        return self.in_degree[self.node_ids[callee]]
+
+    def most_called(self, limit: int = 10) -> list[tuple[Callee, int]]:
+        top = sorted(range(len(self.nodes)), key=self.in_degree.__getitem__, reverse=True)[:limit]
+        return [(self.nodes[node_id], self.in_degree[node_id]) for node_id in top]
@@ -1,32 +1,4 @@
-from typing import Callable, Iterable, Iterator
-
-from src.code_objs.line import CodeLine, EmptyLine, LineType, ObjectLines
-
-
-def object_parser(
-        iterator: Iterator[CodeLine],
-        handler: Callable,
-        condition: Callable
-):
-    end_line = None
-    while True:
-        try:
-            if end_line is not None:
-                line = end_line
-                end_line = None
-            else:
-                line = next(iterator)
-
-            parsed = list(line.split())
-
-            if not parsed:
-                continue  # skip empty lines
-
-            if condition(parsed):
-                end_line = handler(line, iterator)
-
-        except StopIteration:
-            break
+from src.code_objs.line import CodeLine, CommentLine, EmptyLine, LineType, ObjectLines
 
 
 class CodeObject:
@@ -36,29 +8,33 @@ class CodeObject:
         self.path = '.'.join([module_import_path, name])
         self.name = name
         self.body = body
+        self.definition: ObjectLines | None = None
+        # First and last line numbers of the object in the module
+        self.span: tuple[int, int] = (0, 0)
+        # Classes and functions defined inside of functions and classes (not methods)
+        self.nested: list[CodeObject] = []
 
     def __repr__(self):
         return f'{self.__class__.__name__} <{self.name}> in {self.path}'
 
-    @classmethod
-    def parse_name(cls, def_line):
-        raise NotImplementedError
+    def calculate_span(self):
+        """ From the definition line till the last not empty line of the body """
+        end_lineno = self.definition.end_lineno
+        for body_line in reversed(self.body):
+            if type(body_line) not in (EmptyLine, CommentLine):
+                end_lineno = body_line.end_lineno
+                break
 
-    @classmethod
-    def parse(cls,
-              code_line: ObjectLines,
-              file_lst: Iterable[ObjectLines],
-              abs_module_import_path: str):
-        """ Extracting all info about object into new instance """
-        body = []
-        name = cls.parse_name(code_line)
+        self.span = (self.definition.lineno, end_lineno)
 
-        obj_line = None
-        for obj_line in file_lst:
-            if not isinstance(obj_line, EmptyLine) and \
-                    obj_line.indent == code_line.indent:
-                break
+    def release_body(self):
+        """ Drop the parsed lines, the name, path and span are kept """
+        self.body = []
+        self.definition = None
 
-            body.append(obj_line)
+        for obj in self.nested:
+            obj.release_body()
 
-        return cls(name, abs_module_import_path, body), obj_line
+    @classmethod
+    def parse_name(cls, def_line):
+        raise NotImplementedError
@@ -2,7 +2,7 @@ import typing as t
 
 from src.code_objs.callables import CodeObject
 from src.code_objs.functions import Function
-from src.code_objs.line import ClassLine, CodeLine, FunctionLine
+from src.code_objs.line import ClassLine, CodeLine
 
 
 class Class(CodeObject):
@@ -14,19 +14,12 @@ class Class(CodeObject):
 
         self.magic_methods: t.List[Function] = []
         self.methods: t.List[Function] = []
+        self.bases: t.List[str] = []
 
-        functions: t.List[Function] = []
-
-        line_iter = iter(body)
-        while True:
-            try:
-                cline = next(line_iter)
-            except StopIteration:
-                break
-
-            if isinstance(cline, FunctionLine):
-                cls, end_line = Function.parse(cline, line_iter, self.path)
-                functions.append(cls)
+    def set_methods(self, functions: t.List[Function]):
+        """ Split functions defined in the class body into magic and regular methods """
+        self.magic_methods = []
+        self.methods = []
 
         for fun in functions:
             if fun.name in self.magic_method_names:
@@ -34,7 +27,11 @@ class Class(CodeObject):
             else:
                 self.methods.append(fun)
 
-        del functions
+    def release_body(self):
+        super(Class, self).release_body()
+
+        for method in self.methods + self.magic_methods:
+            method.release_body()
 
     @classmethod
     def parse_name(cls, def_line: 'ClassLine'):
@@ -48,3 +45,38 @@ class Class(CodeObject):
 
         idx = min((class_name.find(':'), class_name.find('(')))
         return class_name[:idx]
+
+    @classmethod
+    def parse_bases(cls, def_line: 'ClassLine') -> t.List[str]:
+        """ Extract base class expressions from the definition line:
+            `class A(b.B, C[int], metaclass=M):` -> ['b.B', 'C']
+        """
+        code_line = def_line.code_line.data
+        start = code_line.find('(')
+
+        if start == -1 or start > code_line.find(':'):
+            return []
+
+        bases = []
+        depth = 0
+        current = ''
+        for sym in code_line[start + 1:]:
+            if sym in '([{':
+                depth += 1
+            elif sym in ')]}':
+                if depth == 0:
+                    bases.append(current)
+                    break
+                depth -= 1
+            elif sym == ',' and depth == 0:
+                bases.append(current)
+                current = ''
+                continue
+
+            current += sym
+
+        return [
+            base.split('[')[0].strip()
+            for base in bases
+            if base.strip() and '=' not in base.split('[')[0]
+        ]
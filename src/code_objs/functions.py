@@ -1,5 +1,3 @@
-from typing import Iterator
-
 from src.code_objs.callables import CodeObject
 from src.code_objs.line import FunctionLine
 
@@ -9,21 +7,10 @@ class Function(CodeObject):
     todo: define is this a function or method
     """
 
-    @classmethod
-    def handler(cls, line: str, iterator: Iterator, abs_module_import_path: str, functions: list):
-        fun, end_line = cls.parse(line, iterator, abs_module_import_path)
-
-        if fun:
-            functions.append(fun)
-
-        return end_line
-
-    @staticmethod
-    def condition(parsed):
-        return all(['def' == parsed[0], 'self' not in parsed[1]])
-
     @classmethod
     def parse_name(cls, def_line: 'FunctionLine'):
-        fun_name = def_line.code_line.split()[1]
+        # `async def name(` has the name after the `def` keyword too
+        parsed = def_line.code_line.split()
+        fun_name = parsed[parsed.index('def') + 1]
         idx = fun_name.find('(')
         return fun_name[:idx]
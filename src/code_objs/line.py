@@ -60,7 +60,8 @@ def extract_one_object(iter_str_lines: Iterator[str]) -> list[str] | None:
         else:
             if last_symbol in pars:
                 are_pars_opened.append(last_symbol)
-            elif '"""' in str_line:
+            elif str_line.count('"""') == 1:
+                # One-line docstring is closed on the same line
                 are_pars_opened.append('"""')
             elif last_symbol not in ',\\':
                 break
@@ -88,6 +89,7 @@ def parse_objects_from_file(iter_str_lines: Iterator[str]) -> Union['LineType',
     instance = CodeLine(
         (' '.join(line_stack)).replace('\n', '')
     )
+    instance.lines_amount = len(line_stack)
 
     if instance.has_import():
         return ImportLine(instance)
@@ -113,6 +115,9 @@ def parse_objects_from_file(iter_str_lines: Iterator[str]) -> Union['LineType',
 class CodeLine(UserString):
     """ Object representation of the code essentials """
 
+    lineno: int = 0
+    lines_amount: int = 1
+
     def __init__(self, str_line: str):
         self.indent = len(str_line) - len(str_line.lstrip(' '))
 
@@ -122,6 +127,10 @@ class CodeLine(UserString):
 
         self.parsed = set(str_line.split())
 
+    @property
+    def end_lineno(self) -> int:
+        return self.lineno + self.lines_amount - 1
+
     def has_import(self):
         if 'import' not in self.parsed:
             return False
@@ -161,6 +170,14 @@ class LineType(ABC):
     def __repr__(self):
         return f'<{self.__class__.__name__} {self.code_line}>'
 
+    @property
+    def lineno(self) -> int:
+        return self.code_line.lineno
+
+    @property
+    def end_lineno(self) -> int:
+        return self.code_line.end_lineno
+
     def __bool__(self):
         return bool(self.code_line)
 
@@ -214,7 +231,7 @@ class ImportLine(LineType):
     def __init__(self, code_line: 'CodeLine'):
         super(ImportLine, self).__init__(code_line)
 
-        if code_line.startswith('from'):
+        if self.is_from_import():
             # 1+ objects from module
             _, source, _, imports = code_line.split(maxsplit=3)
             self.import_from = source
@@ -233,6 +250,27 @@ class ImportLine(LineType):
             self.import_from = import_model.source
             self.import_what = [import_model]
 
+    def is_from_import(self) -> bool:
+        return self.code_line.lstrip().startswith('from')
+
+    def bound_names(self) -> dict[str, str]:
+        """ Names bound by the import in the module namespace with their dotted targets:
+            `from a.b import c as d` -> {'d': 'a.b.c'}, `import a.b` -> {'a.b': 'a.b'}
+        """
+        names = {}
+
+        for model in self.import_what:
+            if self.is_from_import():
+                if model.module == '*':
+                    continue
+                # `from . import mod` -- the source is already a relative prefix
+                separator = '' if self.import_from.endswith('.') else '.'
+                names[model.alias or model.module] = f'{self.import_from}{separator}{model.module}'
+            else:
+                names[model.alias or model.as_list[0]] = model.as_list[0]
+
+        return names
+
 
 class EmptyLine(LineType):
     """ Managing empty lines """
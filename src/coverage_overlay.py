@@ -0,0 +1,213 @@
+import sqlite3
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from src.builder import SKIPPED_LINES
+from src.code_objs.callables import CodeObject
+from src.code_objs.classes import Class
+from src.linker import Linker
+from src.tree import Module
+
+# Lines which are never reported as executed by the tracer
+NOT_STATEMENTS = frozenset(('else:', 'finally:'))
+KIND_PLURALS = {'module': 'modules', 'class': 'classes', 'function': 'functions'}
+
+
+@dataclass
+class ObjectCoverage:
+    """ Covered statements of the module, class or function """
+    name: str
+    kind: str
+    statements: int
+    covered: int
+
+    @property
+    def ratio(self) -> float:
+        return self.covered / self.statements if self.statements else 1.0
+
+
+def statement_linenos(module: Module) -> list[int]:
+    """ Sorted first line numbers of logical lines which are statements:
+        empty lines, comments, docstrings and `else:`-like lines are skipped
+    """
+    linenos = []
+    for line in module.content:
+        if type(line) in SKIPPED_LINES:
+            continue
+
+        code_line = getattr(line, 'code_line', line)
+        text = code_line.data.strip()
+        if text[:1] in ('"', "'") or text in NOT_STATEMENTS:
+            continue
+
+        linenos.append(code_line.lineno)
+
+    return linenos
+
+
+def linenos_mask(linenos: Iterable[int]) -> int:
+    """ Line numbers as bits of an integer, the same layout as coverage `numbits` """
+    linenos = list(linenos)
+    bits = bytearray((max(linenos, default=0) >> 3) + 1)
+    for lineno in linenos:
+        bits[lineno >> 3] |= 1 << (lineno & 7)
+
+    return int.from_bytes(bits, 'little')
+
+
+def read_coverage_db(path: Path) -> dict[str, int]:
+    """ Measured file path -> executed lines mask, all contexts are merged.
+        Line mode data is read by one query as `numbits` blobs, branch mode
+        arcs are concatenated per file by SQLite, so there is a row per file
+        instead of a row per arc.
+    """
+    connection = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    try:
+        paths = dict(connection.execute('SELECT id, path FROM file'))
+        has_arcs = connection.execute("SELECT value FROM meta WHERE key = 'has_arcs'").fetchone()
+
+        masks: dict[int, int] = {}
+        if has_arcs and bool(int(has_arcs[0])):
+            for file_id, from_linenos, to_linenos in connection.execute(
+                'SELECT file_id, group_concat(fromno), group_concat(tono) FROM arc GROUP BY file_id'
+            ):
+                # Negative line numbers are entries to and exits from code objects
+                linenos = set(map(int, from_linenos.split(',')))
+                linenos.update(map(int, to_linenos.split(',')))
+                masks[file_id] = linenos_mask(lineno for lineno in linenos if lineno > 0)
+        else:
+            for file_id, numbits in connection.execute('SELECT file_id, numbits FROM line_bits'):
+                masks[file_id] = masks.get(file_id, 0) | int.from_bytes(numbits, 'little')
+    finally:
+        connection.close()
+
+    return {paths[file_id]: mask for file_id, mask in masks.items()}
+
+
+def count_bits(mask: int, start: int, end: int) -> int:
+    """ Set bits from `start` till `end` inclusive """
+    return ((mask >> start) & ((1 << (end - start + 1)) - 1)).bit_count()
+
+
+class CoverageOverlay:
+    """ Coverage of modules, classes and functions of `Linker` from `.coverage`
+        database. Every module is joined at once: executed lines mask is masked
+        by the module statements, then for every object span statements are
+        counted by binary search and covered ones by bits count.
+    """
+
+    def __init__(self, linker: Linker, executed: dict[str, int]):
+        self.linker = linker
+        self.by_name: dict[str, ObjectCoverage] = {}
+
+        executed_by_module = self._match_modules(executed)
+        self.measured_modules = len(executed_by_module)
+        for module, executed_mask in executed_by_module.values():
+            self._join_module(module, executed_mask)
+
+    def __repr__(self):
+        return f'<CoverageOverlay {self.measured_modules} measured modules>'
+
+    @classmethod
+    def load(cls, linker: Linker, path: Path) -> 'CoverageOverlay':
+        return cls(linker, read_coverage_db(path))
+
+    def _match_modules(self, executed: dict[str, int]) -> dict[str, tuple[Module, int]]:
+        """ Module import path -> module and its executed lines mask. Measured files are
+            matched by the same absolute path, by the path relative to the project root
+            (`relative_files`) or by the longest suffix with a directory, so databases
+            measured in other checkout (CI) are joined too. Files of the project root
+            have no directory in the suffix, they are matched in the checkout roots found
+            by the other files. Masks of files matched to one module are merged.
+        """
+        root = self.linker.root.path.resolve()
+        by_absolute, by_relative = {}, {}
+        for module_data in self.linker.values():
+            module = module_data['module']
+            path = module.path.resolve()
+            by_absolute[str(path)] = module
+            by_relative[path.relative_to(root).as_posix()] = module
+
+        matched: dict[str, tuple[Module, int]] = {}
+
+        def add(module_: Module, executed_mask_: int):
+            _, merged_mask = matched.get(module_.abs_import, (module_, 0))
+            matched[module_.abs_import] = module_, merged_mask | executed_mask_
+
+        checkout_roots = set()
+        unmatched = []
+        for file_path, executed_mask in executed.items():
+            module = by_absolute.get(file_path) or by_relative.get(Path(file_path).as_posix())
+            if module is None:
+                parts = Path(file_path).parts
+                for idx in range(1, len(parts) - 1):
+                    module = by_relative.get('/'.join(parts[idx:]))
+                    if module is not None:
+                        checkout_roots.add(Path(*parts[:idx]))
+                        break
+
+            if module is None:
+                unmatched.append((file_path, executed_mask))
+            else:
+                add(module, executed_mask)
+
+        for file_path, executed_mask in unmatched:
+            path = Path(file_path)
+            module = by_relative.get(path.name) if path.parent in checkout_roots else None
+            if module is not None:
+                add(module, executed_mask)
+
+        return matched
+
+    def _join_module(self, module: Module, executed_mask: int):
+        statements = statement_linenos(module)
+        covered_mask = executed_mask & linenos_mask(statements)
+
+        def add(name: str, kind: str, start: int, end: int):
+            self.by_name[name] = ObjectCoverage(
+                name=name,
+                kind=kind,
+                statements=bisect_right(statements, end) - bisect_left(statements, start),
+                covered=count_bits(covered_mask, start, end),
+            )
+
+        def add_object(obj: CodeObject):
+            add(obj.path, 'class' if type(obj) is Class else 'function', *obj.span)
+            for nested in obj.nested:
+                add_object(nested)
+
+        add(module.abs_import, 'module', 0, statements[-1] if statements else 0)
+        for class_ in module.classes:
+            add_object(class_)
+            for method in class_.methods + class_.magic_methods:
+                add_object(method)
+
+        for function in module.functions:
+            add_object(function)
+
+    def get(self, name: str) -> ObjectCoverage | None:
+        """ Coverage by module import path or class and function path """
+        return self.by_name.get(name)
+
+    def least_covered(self, kind: str = 'module', limit: int = 10) -> list[ObjectCoverage]:
+        ranked = sorted(
+            (coverage for coverage in self.by_name.values() if coverage.kind == kind and coverage.statements),
+            key=lambda coverage: (coverage.ratio, -coverage.statements)
+        )
+        return ranked[:limit]
+
+    def print_report(self, limit: int = 10):
+        modules = [coverage for coverage in self.by_name.values() if coverage.kind == 'module']
+        statements = sum(coverage.statements for coverage in modules)
+        covered = sum(coverage.covered for coverage in modules)
+        print(
+            f'Coverage of {self.measured_modules} measured modules: '
+            f'{covered}/{statements} statements ({covered / (statements or 1):.1%})'
+        )
+
+        for kind, kind_plural in KIND_PLURALS.items():
+            print(f'The least covered {kind_plural}:')
+            for coverage in self.least_covered(kind, limit):
+                print(f'  {coverage.ratio:7.1%} {coverage.covered:6}/{coverage.statements:<6} {coverage.name}')
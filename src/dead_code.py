@@ -0,0 +1,195 @@
+import re
+from typing import Iterable
+
+from src.call_graph import STRINGS_RE
+from src.code_objs.classes import Class
+from src.code_objs.functions import Function
+from src.code_objs.line import ClassLine, CommentLine, EmptyLine, FunctionLine, ImportLine, VariableLine
+from src.code_objs.variables import Variable
+from src.hierarchy import ClassHierarchy
+from src.linker import Linker
+from src.tree import DefinitiveObjects, Module
+from src.utils import Bitset
+
+NAME_RE = re.compile(r'(?<![\w.])([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)')
+
+ReachableObject = Module | DefinitiveObjects
+
+
+def iter_referenced_names(lines: Iterable) -> Iterable[str]:
+    """ Yields dotted names used in the lines, assignment targets of variables are skipped """
+    for line in lines:
+        if isinstance(line, (EmptyLine, CommentLine, ImportLine)):
+            continue
+
+        code_line = getattr(line, 'code_line', line).data
+        if isinstance(line, VariableLine):
+            code_line = code_line.split('=', maxsplit=1)[-1]
+
+        code_line = STRINGS_RE.sub('""', code_line).split('#', maxsplit=1)[0]
+        yield from NAME_RE.findall(code_line)
+
+
+class DeadCodeFinder:
+    """ Mark-and-sweep reachability from entry modules over imports and name references.
+        Every module, class, module level function and global gets a dense id,
+        marks are kept in a `Bitset` and references are extracted only for reached objects.
+        Methods are considered alive together with their class.
+    """
+
+    def __init__(self, linker: Linker, hierarchy: ClassHierarchy):
+        self.linker = linker
+        self.hierarchy = hierarchy
+
+        self.nodes: list[ReachableObject] = []
+        self.node_ids: dict[ReachableObject, int] = {}
+        self.node_modules: list[Module] = []
+        # Module import path -> name -> ids of all module level definitions with the name:
+        # conditional definitions and reassigned globals are alive together
+        self.named_ids: dict[str, dict[str, list[int]]] = {}
+
+        for module_data in self.linker.values():
+            module = module_data['module']
+            self._add_node(module, module)
+
+            for obj in module.list_objects():
+                self._add_node(obj, module)
+
+        self.marked = Bitset(len(self.nodes))
+
+    def _add_node(self, obj: ReachableObject, module: Module):
+        node_id = len(self.nodes)
+        self.node_ids[obj] = node_id
+        self.nodes.append(obj)
+        self.node_modules.append(module)
+
+        if obj is not module:
+            self.named_ids.setdefault(module.abs_import, {}).setdefault(obj.name, []).append(node_id)
+
+    def _referenced_ids(self, obj: ReachableObject) -> list[int]:
+        """ Ids of the resolved object and of the other definitions with its name in its module """
+        node_id = self.node_ids.get(obj)
+        if node_id is None:
+            return []
+
+        if isinstance(obj, Module):
+            return [node_id]
+
+        return self.named_ids[self.node_modules[node_id].abs_import][obj.name]
+
+    def mark(self, entries: Iterable[str]):
+        stack = []
+        for entry in entries:
+            stack.append(self.node_ids[self.linker.find_entry_module(entry)])
+
+        while stack:
+            node_id = stack.pop()
+            if node_id in self.marked:
+                continue
+
+            self.marked.add(node_id)
+
+            for obj in self.iter_references(self.nodes[node_id], self.node_modules[node_id]):
+                for ref_id in self._referenced_ids(obj):
+                    if ref_id not in self.marked:
+                        stack.append(ref_id)
+
+    def sweep(self) -> dict[str, list[ReachableObject]]:
+        """ Unreached objects grouped by kind """
+        report = {'modules': [], 'classes': [], 'functions': [], 'variables': []}
+
+        for node_id in self.marked.iter_unset():
+            obj = self.nodes[node_id]
+
+            if isinstance(obj, Module):
+                report['modules'].append(obj)
+            elif isinstance(obj, Class):
+                report['classes'].append(obj)
+            elif isinstance(obj, Function):
+                report['functions'].append(obj)
+            elif not (obj.name.startswith('__') and obj.name.endswith('__')):
+                report['variables'].append(obj)
+
+        return report
+
+    def iter_references(self, obj: ReachableObject, module: Module) -> Iterable[ReachableObject]:
+        if isinstance(obj, Module):
+            yield from self._module_references(obj)
+            return
+
+        # The object is alive only if its module is executed
+        yield module
+
+        if isinstance(obj, Class):
+            yield from self.hierarchy.bases.get(obj, [])
+
+        if isinstance(obj, Variable):
+            lines = obj.body[:1]
+        else:
+            # Definition line holds arguments annotations and defaults
+            lines = [obj.definition, *obj.body] if obj.definition is not None else obj.body
+        yield from self._resolve_names(module, iter_referenced_names(lines))
+
+    def _module_references(self, module: Module) -> Iterable[ReachableObject]:
+        # Importing `pkg.sub.mod` executes `pkg` and `pkg.sub` packages first
+        parts = module.abs_import.split('.')
+        for idx in range(1, len(parts)):
+            package = self.linker.find_module('.'.join(parts[:idx]))
+            if package is not None:
+                yield package
+
+        for imported in self.linker[module.abs_import]['imports']:
+            if isinstance(imported, Module):
+                yield imported
+
+        for qualified in self.linker.imported_names(module).values():
+            yield from self._resolve_prefixes(qualified, self.linker.resolve_qualified)
+
+        lines, decorated = self._split_module_level(module)
+        yield from decorated
+        yield from self._resolve_names(module, iter_referenced_names(lines))
+
+    @staticmethod
+    def _split_module_level(module: Module) -> tuple[list, list[Class | Function]]:
+        """ Module content outside classes and functions and the decorated definitions:
+            decorators register them (routes, tasks, fixtures), so they are alive with the module
+        """
+        nested = set()
+        definitions = {}
+        for obj in module.classes + module.functions:
+            nested.update(id(line) for line in obj.body)
+            definitions[id(obj.definition)] = obj
+
+        lines = []
+        decorated = []
+        is_decorated = False
+        for line in module.content:
+            if id(line) in nested:
+                continue
+
+            if isinstance(line, (ClassLine, FunctionLine)):
+                if is_decorated and id(line) in definitions:
+                    decorated.append(definitions[id(line)])
+                is_decorated = False
+                continue
+
+            if not isinstance(line, (EmptyLine, CommentLine)):
+                is_decorated = getattr(line, 'code_line', line).data.lstrip().startswith('@')
+
+            lines.append(line)
+
+        return lines, decorated
+
+    def _resolve_names(self, module: Module, names: Iterable[str]) -> Iterable[ReachableObject]:
+        for name in names:
+            yield from self._resolve_prefixes(name, lambda prefix: self.linker.resolve_name(module, prefix))
+
+    @staticmethod
+    def _resolve_prefixes(dotted_name: str, resolver) -> Iterable[ReachableObject]:
+        """ `pkg.mod.func.attr` resolves the longest resolvable prefix (`pkg.mod.func`) """
+        parts = dotted_name.split('.')
+        for idx in range(len(parts), 0, -1):
+            resolved = resolver('.'.join(parts[:idx]))
+            if resolved is not None:
+                yield resolved
+                return
@@ -0,0 +1,131 @@
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Iterator
+
+from src.backends import BACKENDS, ParsingBackend
+from src.code_objs.callables import CodeObject
+from src.code_objs.classes import Class
+from src.tree import Folder, Module
+
+SYNTHETIC_MODULE_PATH = Path(__file__).parent / 'templates' / 'synthetic_module.py.tmpl'
+
+
+def generate_synthetic_project(path: Path, modules: int = 100, package: str = 'synthetic') -> Path:
+    """ Writes the package with constructions line heuristics find hard: multi-line
+        definitions and imports, nested and decorated definitions, keywords in strings
+    """
+    template = SYNTHETIC_MODULE_PATH.read_text(encoding='utf-8')
+    package_path = path / package
+    package_path.mkdir(parents=True, exist_ok=True)
+    (package_path / '__init__.py').write_text('', encoding='utf-8')
+
+    for idx in range(modules):
+        (package_path / f'module_{idx}.py').write_text(
+            template.format(package=package, idx=idx, next_idx=(idx + 1) % modules),
+            encoding='utf-8'
+        )
+
+    return path
+
+
+def extract_objects(module: Module) -> set[str]:
+    """ Comparable view of what the backend extracted from the module """
+    objects = {
+        f'import {name} -> {target}'
+        for import_ in module.imports
+        for name, target in import_.bound_names().items()
+    }
+    objects.update(f'variable {variable.path}' for variable in module.global_variables)
+    objects.update(f'function {function.path} {function.span}' for function in module.functions)
+
+    for class_ in module.classes:
+        objects.add(f'class {class_.path}({", ".join(class_.bases)}) {class_.span}')
+        objects.update(
+            f'method {method.path} {method.span}'
+            for method in class_.methods + class_.magic_methods
+        )
+
+    objects.update(
+        f'nested {obj.path} {obj.span}'
+        for top_level in module.classes + module.functions
+        for obj in iter_nested(top_level)
+    )
+
+    return objects
+
+
+def iter_nested(obj: CodeObject) -> Iterator[CodeObject]:
+    """ Nested definitions of the object and of its methods at any depth """
+    for child in obj.nested:
+        yield child
+        yield from iter_nested(child)
+
+    if isinstance(obj, Class):
+        for method in obj.methods + obj.magic_methods:
+            yield from iter_nested(method)
+
+
+@dataclass
+class BackendRun:
+    backend: str
+    seconds: float = 0.0
+    peak_memory_mb: float = 0.0
+    modules: int = 0
+    objects: dict[str, set[str]] = field(default_factory=dict)
+
+
+def parse_project(project: Path, backend: ParsingBackend) -> Folder:
+    root = Folder(dir_path=project, root_path=project, backend=backend)
+    root.parse_dir()
+    root.calculate_import_range()
+    root.parse_modules()
+    return root
+
+
+def run_backend(project: Path, backend_name: str) -> BackendRun:
+    """ Parses the project twice: timed without tracing and traced for the memory peak """
+    run = BackendRun(backend_name)
+
+    started = perf_counter()
+    root = parse_project(project, BACKENDS[backend_name]())
+    run.seconds = perf_counter() - started
+
+    run.objects = {module.abs_import: extract_objects(module) for module in root.list_modules()}
+    run.modules = len(run.objects)
+    del root
+
+    tracemalloc.start()
+    parse_project(project, BACKENDS[backend_name]())
+    run.peak_memory_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+
+    return run
+
+
+def compare_backends(project: Path, backends: list[str] | None = None) -> list[BackendRun]:
+    return [run_backend(project, backend_name) for backend_name in backends or list(BACKENDS)]
+
+
+def print_comparison(project: Path, runs: list[BackendRun], max_differences: int = 20):
+    print(f'Backends on {project}:')
+    for run in runs:
+        print(
+            f'  {run.backend:<8} {run.seconds:8.3f} s  {run.peak_memory_mb:8.1f} MB  '
+            f'{run.modules} modules, {sum(map(len, run.objects.values()))} objects'
+        )
+
+    base = runs[0]
+    for run in runs[1:]:
+        differences = []
+        for abs_import in sorted(base.objects.keys() | run.objects.keys()):
+            base_objects = base.objects.get(abs_import, set())
+            run_objects = run.objects.get(abs_import, set())
+
+            differences.extend(f'- {base.backend}: {obj}' for obj in sorted(base_objects - run_objects))
+            differences.extend(f'+ {run.backend}: {obj}' for obj in sorted(run_objects - base_objects))
+
+        print(f'{len(differences)} differences between {base.backend} and {run.backend}')
+        for difference in differences[:max_differences]:
+            print(f'  {difference}')
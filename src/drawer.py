@@ -2,8 +2,25 @@ from collections import namedtuple
 
 from pyvis import network as net
 
+from src.code_objs.classes import Class
+from src.coverage_overlay import CoverageOverlay
+from src.hierarchy import ClassHierarchy
+from src.import_time import ImportCost
+from src.libraries import FIRST_PARTY, MISSING, STDLIB, THIRD_PARTY, ImportClassifier
 from src.linker import Linker
-from src.tree import Module
+
+LIBRARY_COLORS = {
+    STDLIB: '#8FD18B',
+    THIRD_PARTY: '#DBE129',
+    FIRST_PARTY: '#7FA7E0',
+    MISSING: '#E06C6C',
+}
+
+
+def heat_color(ratio: float) -> str:
+    """ Hex colour from white (0) to red (1) """
+    channel = int(255 * (1 - min(max(ratio, 0.0), 1.0)))
+    return f'#FF{channel:02X}{channel:02X}'
 
 
 class GraphManager:
@@ -12,13 +29,25 @@ class GraphManager:
     def __init__(self, linker: Linker):
         self.linker = linker
 
-    def create_import_graph(self,width: int = 1600, height: int = 1000):
+    def create_import_graph(self,
+                            width: int = 1600,
+                            height: int = 1000,
+                            import_cost: ImportCost | None = None,
+                            classifier: ImportClassifier | None = None,
+                            coverage: CoverageOverlay | None = None):
         """ Creates graph from import objects in Linker
 
         :param width: pixels
         :param height: pixels
+        :param import_cost: measured import times, nodes are sized and coloured by them
+        :param classifier: libraries are coloured by kind (stdlib, third-party, ...)
+        :param coverage: project modules are coloured by test coverage,
+                         nodes have one colour so it can not go with `import_cost`
         :return: network graph with all imports as connected nodes
         """
+        if import_cost is not None and coverage is not None:
+            raise ValueError('Import graph is coloured either by import cost or by coverage, not both')
+
         Edge = namedtuple('Edge', 'to_ from_')
         graph = net.Network(
             height=f'{height}px',
@@ -26,31 +55,139 @@ class GraphManager:
             directed=True
         )
 
-        for lib, descr in self.linker.items():
-            edges_lst = []
-            new_libs = set()
-            new_modules = {lib}
-            for import_ in descr['imports']:
-                module = import_['module']
+        new_libs = set()
+        new_modules = set(self.linker)
+        edges_lst = []
+        for from_, to_edge, is_module in self.linker.iter_import_edges():
+            if not is_module:
+                new_libs.add(to_edge)
 
-                if isinstance(module, Module):
-                    to_edge = module.abs_import
-                    new_modules.add(to_edge)
-                else:
-                    to_edge = str(module)
-                    new_libs.add(to_edge)
+            edges_lst.append(Edge(to_edge, from_))
 
-                edges_lst.append(Edge(to_edge, lib))
+        if import_cost is None:
+            if classifier is None:
+                graph.add_nodes(
+                    list(new_libs),
+                    color=['#DBE129'] * len(new_libs)
+                )
+            else:
+                self.add_classified_library_nodes(graph, list(new_libs), classifier)
+            if coverage is None:
+                graph.add_nodes(
+                    list(new_modules),
+                    color=['blue'] * len(new_modules)
+                )
+            else:
+                self.add_coverage_nodes(graph, list(new_modules), coverage)
+        else:
+            self.add_import_cost_nodes(graph, list(new_libs) + list(new_modules), import_cost)
 
-            graph.add_nodes(
-                list(new_libs),
-                color=['#DBE129'] * len(new_libs)
+        graph.add_edges(edges_lst)
+
+        return graph
+
+    @staticmethod
+    def add_classified_library_nodes(graph: net.Network, names: list[str], classifier: ImportClassifier):
+        """ Library nodes coloured by kind, distribution is shown for third-party ones """
+        colors, titles = [], []
+        for name in names:
+            kind, distribution = classifier.classify(name)
+            colors.append(LIBRARY_COLORS[kind])
+            titles.append(f'{name}: {kind}' + (f' ({distribution})' if distribution else ''))
+
+        graph.add_nodes(names, color=colors, title=titles)
+
+    @staticmethod
+    def add_import_cost_nodes(graph: net.Network, names: list[str], import_cost: ImportCost):
+        """ Nodes sized and coloured (white -> red) by cumulative import time,
+            not imported ones are small and grey
+        """
+        max_cumulative = max((timing.cumulative_us for timing in import_cost.timings), default=0) or 1
+
+        sizes, colors, titles = [], [], []
+        for name in names:
+            timing = import_cost.get(name)
+            if timing is None:
+                sizes.append(5)
+                colors.append('#CCCCCC')
+                titles.append(f'{name}: not imported')
+                continue
+
+            ratio = timing.cumulative_us / max_cumulative
+            sizes.append(10 + 40 * ratio ** 0.5)
+            colors.append(heat_color(ratio))
+            titles.append(
+                f'{name}: {timing.cumulative_us / 1000:.1f} ms cumulative, {timing.self_us / 1000:.1f} ms self'
+            )
+
+        graph.add_nodes(names, size=sizes, color=colors, title=titles)
+
+    @staticmethod
+    def add_coverage_nodes(graph: net.Network,
+                           names: list[str],
+                           coverage: CoverageOverlay,
+                           labels: list[str] | None = None):
+        """ Nodes coloured from white (covered) to red (not covered),
+            not measured ones are grey
+        """
+        colors, titles = [], []
+        for name in names:
+            object_coverage = coverage.get(name)
+            if object_coverage is None:
+                colors.append('#CCCCCC')
+                titles.append(f'{name}: not measured')
+                continue
+
+            colors.append(heat_color(1 - object_coverage.ratio))
+            titles.append(
+                f'{name}: {object_coverage.ratio:.1%} covered, '
+                f'{object_coverage.covered}/{object_coverage.statements} statements'
             )
+
+        graph.add_nodes(names, label=labels or names, color=colors, title=titles)
+
+    def create_inheritance_graph(self,
+                                 hierarchy: ClassHierarchy,
+                                 width: int = 1600,
+                                 height: int = 1000,
+                                 coverage: CoverageOverlay | None = None):
+        """ Creates graph of class inheritance: edges go from subclass to its base
+
+        :param hierarchy: built class hierarchy of the linked project
+        :param width: pixels
+        :param height: pixels
+        :param coverage: project classes are coloured by test coverage
+        :return: network graph with project classes and their external bases
+        """
+        graph = net.Network(
+            height=f'{height}px',
+            width=f'{width}px',
+            directed=True
+        )
+
+        project_classes = [class_.path for class_ in hierarchy.classes]
+        if coverage is None:
             graph.add_nodes(
-                list(new_modules),
-                color=['blue'] * len(new_modules)
+                project_classes,
+                label=[class_.name for class_ in hierarchy.classes],
+                title=project_classes,
+                color=['blue'] * len(project_classes)
             )
-            graph.add_edges(edges_lst)
+        else:
+            self.add_coverage_nodes(
+                graph, project_classes, coverage, labels=[class_.name for class_ in hierarchy.classes]
+            )
+
+        external_bases = list(hierarchy.external_subclasses)
+        graph.add_nodes(
+            external_bases,
+            color=['#DBE129'] * len(external_bases)
+        )
+
+        graph.add_edges([
+            (class_.path, base.path if isinstance(base, Class) else base)
+            for class_, base in hierarchy.iter_edges()
+        ])
 
         return graph
 
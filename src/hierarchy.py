@@ -0,0 +1,186 @@
+from collections import Counter, defaultdict
+
+from src.code_objs.classes import Class
+from src.linker import Linker
+from src.utils import check_memory_limit
+
+
+class ClassHierarchy:
+    """ Inheritance index of all the project classes.
+        Base classes are resolved through module imports into project `Class` objects,
+        bases outside the project are kept by their qualified names (`pydantic.BaseModel`).
+        MRO, ancestors and descendants are computed on the first query and memoized,
+        so `build` does not pay for the classes nobody asks about.
+    """
+
+    def __init__(self, linker: Linker, memory_limit: float | None = None):
+        """
+        :param memory_limit: peak RSS ceiling in megabytes checked after every module
+        """
+        self.linker = linker
+        self.memory_limit = memory_limit
+
+        self.classes: list[Class] = []
+        self.by_name: dict[str, list[Class]] = defaultdict(list)
+        self.bases: dict[Class, list[Class]] = {}
+        self.subclasses: dict[Class, list[Class]] = defaultdict(list)
+        # Qualified name of not project base -> direct subclasses
+        self.external_subclasses: dict[str, list[Class]] = defaultdict(list)
+        self.external_by_name: dict[str, set[str]] = defaultdict(set)
+
+        self._mro: dict[Class, tuple[Class, ...]] = {}
+        self._ancestors: dict[Class, frozenset[Class]] = {}
+        self._descendants: dict[Class, frozenset[Class]] = {}
+
+    def __repr__(self):
+        return f'<ClassHierarchy {len(self.classes)} classes>'
+
+    def build(self):
+        """ Resolve bases of every class in the linked modules """
+        for module_data in self.linker.values():
+            module = module_data['module']
+
+            for class_ in module.classes:
+                self.classes.append(class_)
+                self.by_name[class_.name].append(class_)
+
+                resolved_bases = []
+                for base in class_.bases:
+                    resolved = self.linker.resolve_name(module, base)
+                    if resolved is class_:
+                        # `class Model(Model):` extends the imported name, not itself
+                        qualified = self.linker.qualify_name(module, base)
+                        resolved = self.linker.resolve_qualified(qualified) if qualified else None
+
+                    if isinstance(resolved, Class):
+                        resolved_bases.append(resolved)
+                        self.subclasses[resolved].append(class_)
+                    elif resolved is None:
+                        qualified = self.linker.qualify_name(module, base) or base
+                        self.external_subclasses[qualified].append(class_)
+                        self.external_by_name[qualified.rsplit('.', maxsplit=1)[-1]].add(qualified)
+
+                self.bases[class_] = resolved_bases
+
+            check_memory_limit(self.memory_limit)
+
+    def mro(self, class_: Class) -> tuple[Class, ...]:
+        """ C3 linearization over project classes (external bases are skipped) """
+        if class_ not in self._mro:
+            for current in self._post_order(class_, self.bases, self._mro):
+                bases = self.bases.get(current, [])
+                # Base without MRO yet is in an inheritance cycle caused by wrong name resolution
+                if len(bases) == 1:
+                    # Single inheritance: C3 merge gives the base MRO as it is
+                    self._mro[current] = (current,) + self._mro.get(bases[0], (bases[0],))
+                else:
+                    sequences = [list(self._mro.get(base, (base,))) for base in bases]
+                    sequences.append(list(bases))
+                    self._mro[current] = (current,) + tuple(self._c3_merge(sequences))
+
+        return self._mro[class_]
+
+    @staticmethod
+    def _post_order(start: Class, edges: dict[Class, list[Class]], done: dict) -> list[Class]:
+        """ Classes reachable from `start`, every one after the classes its edges lead to.
+            Explicit stack: inheritance chains can be deeper than the recursion limit.
+            Already computed classes and cycles are not followed.
+        """
+        order = []
+        seen = {start}
+        stack = [(start, iter(edges.get(start, ())))]
+        while stack:
+            current, targets = stack[-1]
+            for target in targets:
+                if target not in seen and target not in done:
+                    seen.add(target)
+                    stack.append((target, iter(edges.get(target, ()))))
+                    break
+            else:
+                stack.pop()
+                order.append(current)
+
+        return order
+
+    @staticmethod
+    def _c3_merge(sequences: list[list[Class]]) -> list[Class]:
+        """ Sequences are not rebuilt on every step: heads are kept as positions and
+            occurrences in tails as counters, so the merge is linear in the input
+        """
+        sequences = [seq for seq in sequences if seq]
+        positions = [0] * len(sequences)
+        in_tails = Counter(item for seq in sequences for item in seq[1:])
+        merged = set()
+        result = []
+
+        while True:
+            heads = [seq[pos] for seq, pos in zip(sequences, positions) if pos < len(seq)]
+            if not heads:
+                return result
+
+            for head in heads:
+                if not in_tails[head]:
+                    break
+            else:
+                # Inconsistent hierarchy: fall back to the depth-first order
+                head = heads[0]
+
+            result.append(head)
+            merged.add(head)
+
+            for idx, seq in enumerate(sequences):
+                # Merged classes are dropped from every sequence
+                while positions[idx] < len(seq) and seq[positions[idx]] in merged:
+                    positions[idx] += 1
+                    if positions[idx] < len(seq):
+                        in_tails[seq[positions[idx]]] -= 1
+
+    def ancestors(self, class_: Class) -> frozenset[Class]:
+        if class_ not in self._ancestors:
+            self._ancestors[class_] = frozenset(self.mro(class_)[1:])
+
+        return self._ancestors[class_]
+
+    def descendants(self, class_: Class) -> frozenset[Class]:
+        """ All direct and indirect project subclasses """
+        if class_ not in self._descendants:
+            for current in self._post_order(class_, self.subclasses, self._descendants):
+                result = set()
+                for subclass in self.subclasses.get(current, []):
+                    result.add(subclass)
+                    result.update(self._descendants.get(subclass, ()))
+
+                self._descendants[current] = frozenset(result)
+
+        return self._descendants[class_]
+
+    def is_subclass(self, class_: Class, base: Class) -> bool:
+        return class_ is base or base in self.ancestors(class_)
+
+    def subclasses_of(self, name: str) -> frozenset[Class]:
+        """ Descendants of the class by its name, project path or qualified external name.
+            `subclasses_of('BaseModel')` finds children of `pydantic.BaseModel` too.
+        """
+        result = set()
+
+        for class_ in self.by_name.get(name.rsplit('.', maxsplit=1)[-1], []):
+            if name in (class_.name, class_.path):
+                result.update(self.descendants(class_))
+
+        for qualified in self.external_by_name.get(name.rsplit('.', maxsplit=1)[-1], ()):
+            if qualified == name or qualified.endswith(f'.{name}'):
+                for subclass in self.external_subclasses[qualified]:
+                    result.add(subclass)
+                    result.update(self.descendants(subclass))
+
+        return frozenset(result)
+
+    def iter_edges(self):
+        """ Yields (subclass, base) pairs, base is `Class` or qualified external name """
+        for class_, bases in self.bases.items():
+            for base in bases:
+                yield class_, base
+
+        for qualified, subclasses in self.external_subclasses.items():
+            for class_ in subclasses:
+                yield class_, qualified
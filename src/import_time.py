@@ -0,0 +1,138 @@
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.linker import Linker
+
+IMPORT_TIME_PREFIX = 'import time:'
+IMPORT_ENTRY_CODE = 'import sys; __import__(sys.argv[1])'
+
+
+@dataclass
+class ImportTiming:
+    """ One line of `python -X importtime` output, microseconds """
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+    parent: 'ImportTiming | None' = field(default=None, repr=False)
+
+    def chain(self) -> list[str]:
+        """ Import names from the top level import down to this one """
+        chain = []
+        timing = self
+        while timing is not None:
+            chain.append(timing.name)
+            timing = timing.parent
+
+        return chain[::-1]
+
+
+def parse_import_times(output: str) -> list[ImportTiming]:
+    """ Parse `-X importtime` lines. Children are printed before their parent
+        with one more level of indentation, so parents are assigned with a stack.
+    """
+    timings = []
+    pending: list[ImportTiming] = []
+
+    for line in output.splitlines():
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+
+        try:
+            self_us, cumulative_us, name_field = line[len(IMPORT_TIME_PREFIX):].split('|', maxsplit=2)
+            timing = ImportTiming(
+                name=name_field.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(name_field) - len(name_field.lstrip(' ')) - 1) // 2,
+            )
+        except ValueError:
+            continue  # the header line
+
+        while pending and pending[-1].depth > timing.depth:
+            pending.pop().parent = timing
+
+        pending.append(timing)
+        timings.append(timing)
+
+    return timings
+
+
+def measure_import_times(project: Path, import_path: str, timeout: float = 120) -> list[ImportTiming]:
+    """ Imports the module in a fresh interpreter with `-X importtime`,
+        the project root is put on `PYTHONPATH` so project modules are importable
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(project.resolve()), env.get('PYTHONPATH')]))
+
+    # The name is an argument: entries like `my-app` or `01_setup` are not identifiers
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', IMPORT_ENTRY_CODE, import_path],
+        cwd=project,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+
+    timings = parse_import_times(process.stderr)
+    # Interpreter startup imports are always timed, only the entry line tells
+    # the entry was found and executed
+    is_imported = any(timing.name == import_path for timing in timings)
+    if process.returncode == 0 and is_imported:
+        return timings
+
+    errors = [line for line in process.stderr.splitlines() if line and not line.startswith(IMPORT_TIME_PREFIX)]
+    error = errors[-1] if errors else f'exit code {process.returncode}'
+    if not is_imported:
+        raise RuntimeError(f'Import of {import_path} failed: {error}')
+
+    # Exception or `SystemExit` at module level: the imports after it were not measured
+    print(f'Warning: import of {import_path} failed, timings are incomplete: {error}', file=sys.stderr)
+    return timings
+
+
+class ImportCost:
+    """ Measured import times joined onto `Linker` modules and libraries """
+
+    def __init__(self, linker: Linker, timings: list[ImportTiming]):
+        self.linker = linker
+        self.timings = timings
+        self.by_name: dict[str, ImportTiming] = {timing.name: timing for timing in timings}
+
+    def __repr__(self):
+        return f'<ImportCost {len(self.timings)} imports>'
+
+    @classmethod
+    def measure(cls, linker: Linker, entry: str) -> 'ImportCost':
+        module = linker.find_entry_module(entry)
+        import_path = module.abs_import.removesuffix('.__init__')
+
+        return cls(linker, measure_import_times(linker.root.path, import_path))
+
+    def get(self, name: str) -> ImportTiming | None:
+        """ Timing by linker key (`pkg.__init__` is imported as `pkg`) or library name """
+        return self.by_name.get(name.removesuffix('.__init__'))
+
+    def most_expensive(self, limit: int = 10) -> list[ImportTiming]:
+        """ Imports of the project libraries and modules ranked by cumulative time.
+            Chains of the first ones show what to import lazily.
+        """
+        known = {name.removesuffix('.__init__') for name in self.linker} | self.linker.libraries
+        ranked = sorted(
+            (timing for timing in self.timings if timing.name in known),
+            key=lambda timing: timing.cumulative_us,
+            reverse=True
+        )
+        return ranked[:limit]
+
+    def print_ranking(self, limit: int = 10):
+        print('The most expensive imports:')
+        for timing in self.most_expensive(limit):
+            print(
+                f'  {timing.cumulative_us / 1000:9.1f} ms cumulative {timing.self_us / 1000:9.1f} ms self  '
+                f'{" -> ".join(timing.chain())}'
+            )
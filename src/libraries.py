@@ -0,0 +1,138 @@
+import json
+import os
+import sys
+from importlib import metadata
+from pathlib import Path
+from typing import Iterable
+
+from src.linker import Linker
+
+STDLIB = 'stdlib'
+THIRD_PARTY = 'third-party'
+FIRST_PARTY = 'first-party'
+MISSING = 'missing'
+IMPORT_KINDS = (STDLIB, THIRD_PARTY, FIRST_PARTY, MISSING)
+
+DEFAULT_CACHE_PATH = Path.home() / '.cache' / 'pydependance' / 'distributions.json'
+# `sys.path` entries where distributions are installed
+DISTRIBUTION_DIRS = frozenset(('site-packages', 'dist-packages'))
+
+
+def environment_key() -> dict:
+    """ Interpreter and modification times of its distribution directories: installing
+        or removing a distribution changes `site-packages`, so the cached index is rebuilt.
+        The working and the script directories are not keyed, they change all the time.
+    """
+    paths = {}
+    for path in sys.path:
+        if Path(path).name not in DISTRIBUTION_DIRS:
+            continue
+        try:
+            paths[path] = os.stat(path or '.').st_mtime_ns
+        except OSError:
+            continue
+
+    return {'executable': sys.executable, 'paths': paths}
+
+
+def index_distributions() -> dict[str, list[str]]:
+    """ Top level module -> installed distributions providing it. Only metadata files
+        (`top_level.txt`, `RECORD`) are read, nothing is imported.
+    """
+    return {
+        name: sorted(set(distributions))
+        for name, distributions in metadata.packages_distributions().items()
+    }
+
+
+class ImportClassifier:
+    """ Labels imports `Linker` could not resolve as stdlib, installed third-party
+        (with the distribution), first-party or missing. Lookups are by the top level
+        name in sets and dicts, imported modules are never imported.
+    """
+
+    def __init__(self, distributions: dict[str, list[str]], first_party: Iterable[str] = ()):
+        self.distributions = distributions
+        self.first_party = frozenset(first_party)
+        self.stdlib = sys.stdlib_module_names
+
+    def __repr__(self):
+        return f'<ImportClassifier {len(self.distributions)} installed top level modules>'
+
+    @classmethod
+    def load(cls, cache_path: Path | None = DEFAULT_CACHE_PATH, first_party: Iterable[str] = ()) -> 'ImportClassifier':
+        """ Distributions index from the cache file, indexed and saved again
+            when the cache is missing or the environment has changed
+        """
+        environment = environment_key()
+
+        if cache_path is not None:
+            try:
+                with cache_path.open(encoding='utf-8') as i_file:
+                    cache = json.load(i_file)
+            except (OSError, ValueError):
+                cache = {}
+
+            if cache.get('environment') == environment:
+                return cls(cache['distributions'], first_party)
+
+        distributions = index_distributions()
+
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with cache_path.open('w', encoding='utf-8') as o_file:
+                    json.dump({'environment': environment, 'distributions': distributions}, o_file)
+            except OSError as err:
+                # Read-only home or a bad path: the index is still used, just not cached
+                print(f'Warning: distributions index is not cached: {err}', file=sys.stderr)
+
+        return cls(distributions, first_party)
+
+    @classmethod
+    def from_linker(cls, linker: Linker, cache_path: Path | None = DEFAULT_CACHE_PATH) -> 'ImportClassifier':
+        """ Top level packages and modules of the project are first-party """
+        return cls.load(cache_path, first_party={abs_import.partition('.')[0] for abs_import in linker})
+
+    def classify(self, name: str) -> tuple[str, str | None]:
+        """ Kind of the import and the distribution for third-party ones """
+        if name.startswith('.'):
+            return FIRST_PARTY, None
+
+        top_level = name.partition('.')[0]
+        if top_level in self.first_party:
+            return FIRST_PARTY, None
+
+        if top_level in self.stdlib:
+            return STDLIB, None
+
+        distributions = self.distributions.get(top_level)
+        if distributions:
+            return THIRD_PARTY, distributions[0]
+
+        return MISSING, None
+
+    def kind(self, name: str) -> str:
+        return self.classify(name)[0]
+
+    def group(self, names: Iterable[str]) -> dict[str, list[str]]:
+        """ Names by kind, each list is sorted """
+        groups = {kind: [] for kind in IMPORT_KINDS}
+        for name in names:
+            groups[self.kind(name)].append(name)
+
+        for names_of_kind in groups.values():
+            names_of_kind.sort()
+
+        return groups
+
+    def print_summary(self, names: Iterable[str]):
+        print('Imported libraries:')
+        for kind, names_of_kind in self.group(names).items():
+            if kind == THIRD_PARTY:
+                distributions = {self.classify(name)[1] for name in names_of_kind}
+                print(f'  {kind:<12} {len(names_of_kind):5} from {len(distributions)} distributions')
+            elif kind == MISSING and names_of_kind:
+                print(f'  {kind:<12} {len(names_of_kind):5}: {", ".join(names_of_kind[:10])}')
+            else:
+                print(f'  {kind:<12} {len(names_of_kind):5}')
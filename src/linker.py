@@ -1,6 +1,9 @@
 from collections import UserDict
+from pathlib import Path
 
-from src.tree import Folder, Module
+from src.tree import MODULE_SUFFIXES, DefinitiveObjects, Folder, Module, make_relative_import
+
+ResolvedObject = Module | DefinitiveObjects
 
 
 class Linker(UserDict[str, dict]):
@@ -8,6 +11,7 @@ class Linker(UserDict[str, dict]):
         Imports, classes and functions
     """
     root: Folder
+    max_reexport_depth = 8
 
     def __init__(self, root, *args, **kwargs):
         super(Linker, self).__init__(*args, **kwargs)
@@ -15,12 +19,39 @@ class Linker(UserDict[str, dict]):
         self.root = root
         self.libraries = set()
 
+        # (module import path, dotted name) -> resolved object or None
+        self._resolved: dict[tuple[str, str], ResolvedObject | None] = {}
+        self._imported_names: dict[str, dict[str, str]] = {}
+
     def __repr__(self):
         return f'<Project {self.root}>'
 
     def get_module_by_import(self, abs_import) -> Module:
         return self[abs_import]['module']
 
+    def find_module(self, abs_import: str) -> Module | None:
+        """ Module by import path, packages are found through their `__init__` """
+        for key in (abs_import, f'{abs_import}.__init__'):
+            if key in self:
+                return self[key]['module']
+
+        return None
+
+    def find_entry_module(self, entry: str) -> Module:
+        """ Entry is a path to module file (`main.py`, `report.ipynb`) or import path (`pkg.cli`) """
+        path = Path(entry)
+        if not path.is_absolute():
+            path = self.root.path / path
+
+        if path.suffix in MODULE_SUFFIXES and path.is_file():
+            entry = make_relative_import(path, self.root.path)
+
+        module = self.find_module(entry)
+        if module is None:
+            raise KeyError(f'Entry point {entry} is not a project module')
+
+        return module
+
     def gather_modules(self, folder: Folder = None):
         """ Extract all the modules into self dict object """
         folder = folder or self.root
@@ -48,3 +79,98 @@ class Linker(UserDict[str, dict]):
                     self[module.abs_import]['imports'].append(import_)
                 else:
                     self[module.abs_import]['imports'].append(imported_module)
+
+    def iter_import_edges(self):
+        """ Yields (importing module, imported name, is imported name a project module) """
+        for abs_import, module_data in self.items():
+            for import_ in module_data['imports']:
+                if isinstance(import_, Module):
+                    yield abs_import, import_.abs_import, True
+                else:
+                    yield abs_import, import_.import_from, False
+
+    @staticmethod
+    def absolute_import_path(module: Module, dotted: str) -> str:
+        """ Turns relative import (`.sibling`, `..pkg.mod`) into absolute one """
+        if not dotted.startswith('.'):
+            return dotted
+
+        level = len(dotted) - len(dotted.lstrip('.'))
+        package = module.abs_import.split('.')[:-1]
+        if level > 1:
+            package = package[:-(level - 1)]
+
+        return '.'.join(package + [dotted[level:]] if dotted[level:] else package)
+
+    def imported_names(self, module: Module) -> dict[str, str]:
+        """ All names bound by module imports with their absolute dotted targets """
+        try:
+            return self._imported_names[module.abs_import]
+        except KeyError:
+            pass
+
+        names = {}
+        for import_ in module.imports:
+            for local_name, target in import_.bound_names().items():
+                names[local_name] = self.absolute_import_path(module, target)
+
+        self._imported_names[module.abs_import] = names
+        return names
+
+    def qualify_name(self, module: Module, dotted_name: str) -> str | None:
+        """ Absolute dotted path of the imported name (`BaseModel` -> `pydantic.BaseModel`) """
+        imported_names = self.imported_names(module)
+        parts = dotted_name.split('.')
+
+        # The longest bound prefix wins: `import a.b` binds `a.b` for `a.b.C`
+        for idx in range(len(parts), 0, -1):
+            local_name = '.'.join(parts[:idx])
+            if local_name in imported_names:
+                return imported_names[local_name] + dotted_name[len(local_name):]
+
+        return None
+
+    def resolve_name(self, module: Module, dotted_name: str) -> ResolvedObject | None:
+        """ Finds the project object referred by the name inside the module namespace:
+            local definitions first, then imported names. Results are cached.
+        """
+        key = (module.abs_import, dotted_name)
+        if key in self._resolved:
+            return self._resolved[key]
+
+        # Break import cycles: the name is unresolved while it's being resolved
+        self._resolved[key] = None
+        self._resolved[key] = self._resolve_name(module, dotted_name, depth=0)
+
+        return self._resolved[key]
+
+    def resolve_qualified(self, qualified: str, depth: int = 0) -> ResolvedObject | None:
+        """ Finds the project object by absolute dotted path (`pkg.mod.Class`) """
+        module = self.find_module(qualified)
+        if module is not None:
+            return module
+
+        if '.' not in qualified or depth > self.max_reexport_depth:
+            return None
+
+        module_path, name = qualified.rsplit('.', maxsplit=1)
+        module = self.find_module(module_path)
+        if module is None:
+            return None
+
+        return self._resolve_name(module, name, depth + 1)
+
+    def _resolve_name(self, module: Module, dotted_name: str, depth: int) -> ResolvedObject | None:
+        head, _, rest = dotted_name.partition('.')
+
+        if not rest:
+            try:
+                return module.get_object_by_name(head)
+            except KeyError:
+                pass
+
+        qualified = self.qualify_name(module, dotted_name)
+        if qualified is None:
+            return None
+
+        return self.resolve_qualified(qualified, depth)
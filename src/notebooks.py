@@ -0,0 +1,244 @@
+import json
+import re
+from pathlib import Path
+from typing import Iterator, TextIO
+
+NOTEBOOK_SUFFIX = '.ipynb'
+
+WHITESPACE_RE = re.compile(r'\s*')
+STRUCTURE_RE = re.compile(r'["\[\]{}]')
+SCALAR_RE = re.compile(r'[^\s,\]}]*')
+
+# Python code scan for brackets depth: string openers, comments and brackets
+CODE_TOKEN_RE = re.compile(r'"""|' + r"'''" + r'|["\'#()\[\]{}]')
+STRING_END_RE = {
+    '"': re.compile(r'(?:[^"\\]|\\.)*"'),
+    "'": re.compile(r"(?:[^'\\]|\\.)*'"),
+    '"""': re.compile(r'(?:[^"\\]|\\.|"(?!""))*"""'),
+    "'''": re.compile(r"(?:[^'\\]|\\.|'(?!''))*" + r"'''"),
+}
+
+
+class JsonReader:
+    """ Incremental JSON reader over a text file: the buffer holds one chunk and
+        the not consumed tail. Values which are not needed (outputs, images) are
+        skipped by regex scans without decoding and without loading the whole file.
+    """
+
+    def __init__(self, i_file: TextIO, chunk_size: int = 1 << 16):
+        self.i_file = i_file
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+
+    def _fill(self) -> bool:
+        """ Drop consumed part of the buffer and read the next chunk """
+        chunk = self.i_file.read(self.chunk_size)
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return bool(chunk)
+
+    def _error(self, expected: str) -> ValueError:
+        return ValueError(f'Expected {expected} in {self.i_file.name!r}, got {self.buffer[self.pos:self.pos + 20]!r}')
+
+    def peek(self) -> str:
+        """ Next not whitespace character, empty string at the end of the file """
+        while True:
+            self.pos = WHITESPACE_RE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise self._error(repr(char))
+        self.pos += 1
+
+    def _scan_string(self, keep: bool) -> str:
+        """ Consume the string after the opening quote, the raw body is kept on demand.
+            `str.find` jumps over long strings (base64 images) much faster than regex.
+        """
+        parts = []
+        search_from = self.pos
+        while True:
+            quote = self.buffer.find('"', search_from)
+            if quote == -1:
+                # Trailing backslashes stay in the buffer: they may escape the quote of the next chunk
+                end = max(len(self.buffer.rstrip('\\')), self.pos)
+                if keep:
+                    parts.append(self.buffer[self.pos:end])
+                self.pos = end
+
+                if not self._fill():
+                    raise self._error('end of string')
+                search_from = self.pos
+                continue
+
+            escapes = 0
+            while quote - escapes > self.pos and self.buffer[quote - escapes - 1] == '\\':
+                escapes += 1
+
+            if escapes % 2:
+                search_from = quote + 1
+                continue
+
+            if keep:
+                parts.append(self.buffer[self.pos:quote])
+            self.pos = quote + 1
+            return ''.join(parts)
+
+    def read_string(self) -> str:
+        self.expect('"')
+        return json.loads(f'"{self._scan_string(keep=True)}"', strict=False)
+
+    def skip_value(self):
+        char = self.peek()
+        if char == '"':
+            self.pos += 1
+            self._scan_string(keep=False)
+        elif char in ('[', '{'):
+            self._skip_container()
+        else:
+            while True:
+                end = SCALAR_RE.match(self.buffer, self.pos).end()
+                if end < len(self.buffer) or not self._fill():
+                    break
+            self.pos = SCALAR_RE.match(self.buffer, self.pos).end()
+
+    def _skip_container(self):
+        depth = 0
+        while True:
+            match = STRUCTURE_RE.search(self.buffer, self.pos)
+            if match is None:
+                self.pos = len(self.buffer)
+                if not self._fill():
+                    raise self._error('end of container')
+                continue
+
+            self.pos = match.end()
+            char = match.group()
+            if char == '"':
+                self._scan_string(keep=False)
+            elif char in ('[', '{'):
+                depth += 1
+            else:
+                depth -= 1
+                if not depth:
+                    return
+
+    def iter_array(self) -> Iterator[None]:
+        """ Yields before every item, the caller must consume it """
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+
+        while True:
+            yield
+            if self.peek() == ',':
+                self.pos += 1
+            else:
+                self.expect(']')
+                return
+
+    def iter_object(self) -> Iterator[str]:
+        """ Yields keys, the caller must consume every value """
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+
+        while True:
+            key = self.read_string()
+            self.expect(':')
+            yield key
+            if self.peek() == ',':
+                self.pos += 1
+            else:
+                self.expect('}')
+                return
+
+    def read_source(self) -> str:
+        """ Cell source: list of lines or one string """
+        if self.peek() == '"':
+            return self.read_string()
+
+        return ''.join(self.read_string() for _ in self.iter_array())
+
+
+def iter_code_cells(path: Path, chunk_size: int = 1 << 16) -> Iterator[str]:
+    """ Sources of code cells of nbformat 4 notebook, everything else is skipped """
+    with path.open(encoding='utf-8') as i_file:
+        reader = JsonReader(i_file, chunk_size)
+
+        for key in reader.iter_object():
+            if key != 'cells':
+                reader.skip_value()
+                continue
+
+            for _ in reader.iter_array():
+                cell_type, source = None, ''
+                for cell_key in reader.iter_object():
+                    if cell_key == 'cell_type':
+                        cell_type = reader.read_string()
+                    elif cell_key == 'source' and cell_type in (None, 'code'):
+                        source = reader.read_source()
+                    else:
+                        reader.skip_value()
+
+                if cell_type == 'code':
+                    yield source
+
+
+def scan_brackets(line: str, depth: int, triple_quote: str | None) -> tuple[int, str | None, bool]:
+    """ Brackets depth and still open triple-quoted string after the line, strings and
+        comments are skipped. The flag is set when the line is continued by a backslash.
+    """
+    pos = 0
+    while True:
+        if triple_quote is not None:
+            match = STRING_END_RE[triple_quote].match(line, pos)
+            if match is None:
+                return depth, triple_quote, False
+            pos = match.end()
+            triple_quote = None
+
+        match = CODE_TOKEN_RE.search(line, pos)
+        if match is None:
+            return depth, None, line.endswith('\\')
+
+        token = match.group()
+        pos = match.end()
+        if token == '#':
+            return depth, None, False
+        elif len(token) == 3:
+            triple_quote = token
+        elif token in ('"', "'"):
+            match = STRING_END_RE[token].match(line, pos)
+            pos = match.end() if match is not None else len(line)
+        elif token in '([{':
+            depth += 1
+        else:
+            depth = max(depth - 1, 0)
+
+
+def iter_notebook_lines(path: Path) -> Iterator[str]:
+    """ Code cells as lines of one module. IPython magics and shell commands
+        are commented out, so the cells stay valid python. A line is a magic only
+        where a statement starts: `% count` inside brackets is the modulo operator.
+    """
+    for source in iter_code_cells(path):
+        lines = source.splitlines()
+        is_cell_magic = bool(lines) and lines[0].startswith('%%')
+
+        depth, triple_quote, is_continued = 0, None, False
+        for line in lines:
+            is_statement_start = not depth and triple_quote is None and not is_continued
+            if is_cell_magic or (is_statement_start and line.lstrip().startswith(('%', '!'))):
+                line = f'# {line}'
+            else:
+                depth, triple_quote, is_continued = scan_brackets(line, depth, triple_quote)
+            yield f'{line}\n'
+
+        yield '\n'
@@ -2,11 +2,19 @@ from copy import deepcopy
 from pathlib import Path
 from typing import Dict, List
 
+from src.backends import BACKENDS, LineBackend
+from src.call_graph import CallGraph
 from src.code_objs.line import VariableLine
 from src.code_objs.variables import Variable
+from src.coverage_overlay import CoverageOverlay
+from src.dead_code import DeadCodeFinder
 from src.drawer import GraphManager
+from src.hierarchy import ClassHierarchy
+from src.import_time import ImportCost
+from src.libraries import DEFAULT_CACHE_PATH, ImportClassifier
 from src.linker import Linker
-from src.tree import Folder
+from src.tree import Folder, Module
+from src.utils import check_memory_limit, peak_rss_mb
 
 
 def fit_lists_one_size(dict_with_lists: Dict[str, List]):
@@ -29,11 +37,34 @@ class Parser:
         todo: continue
     """
 
-    def __init__(self, project: Path):
+    def __init__(self,
+                 project: Path,
+                 summary_only: bool = False,
+                 memory_limit: float | None = None,
+                 backend: str = LineBackend.name):
+        """
+        :param summary_only: low-memory mode, modules keep only imports and definitions
+                             summaries, so only imports and classes hierarchy are linked
+        :param memory_limit: peak RSS ceiling in megabytes
+        :param backend: name of the parsing engine from `BACKENDS`
+        """
         self.project = project
-        self.root = Folder(dir_path=self.project, root_path=self.project)
+        self.summary_only = summary_only
+        self.memory_limit = memory_limit
+        self.root = Folder(
+            dir_path=self.project,
+            root_path=self.project,
+            summary_only=summary_only,
+            memory_limit=memory_limit,
+            backend=BACKENDS[backend](),
+        )
         self.linker = Linker(self.root)
+        self.hierarchy = ClassHierarchy(self.linker, memory_limit=memory_limit)
+        self._call_graph: CallGraph | None = None
         self.import_graph = GraphManager(self.linker)
+        self.import_cost: ImportCost | None = None
+        self.import_classifier: ImportClassifier | None = None
+        self.coverage: CoverageOverlay | None = None
 
     def __repr__(self):
         return f'Parser on {self.project} with {self.root.calculate_dirs()} dirs ' \
@@ -46,26 +77,96 @@ class Parser:
         self.root.parse_dir()
         self.root.calculate_import_range()
         self.root.parse_modules()
+        check_memory_limit(self.memory_limit)
 
     def build_link_list(self):
         """ Create links between
                 - imports (realized)
-                - todo: functions
-                - todo: classes
+                - functions and methods calls (realized, built on demand by `call_graph`)
+                - classes inheritance (realized)
                 - todo: variables
         """
         self.linker.gather_modules()
         self.linker.build_import_tree()
+        check_memory_limit(self.memory_limit)
+
+        self.hierarchy.build()
+        check_memory_limit(self.memory_limit)
+
+    @property
+    def call_graph(self) -> CallGraph:
+        """ Built on the first access after `build_link_list`, runs which don't
+            query calls don't pay for the pass over all functions bodies
+        """
+        if self._call_graph is None:
+            if self.summary_only:
+                raise ValueError('call graph needs functions bodies, it can not be built with summary_only')
+
+            self._call_graph = CallGraph(self.linker, self.hierarchy)
+            self._call_graph.build()
+            check_memory_limit(self.memory_limit)
+
+        return self._call_graph
+
+    def measure_import_cost(self, entry: str) -> ImportCost:
+        """ Run `python -X importtime` over the entry module, the result is drawn on import graph """
+        self.import_cost = ImportCost.measure(self.linker, entry)
+        return self.import_cost
+
+    def classify_imports(self, cache_path: Path | None = DEFAULT_CACHE_PATH) -> ImportClassifier:
+        """ Label not resolved imports as stdlib, third-party or missing, installed
+            distributions are indexed once and kept in the cache file
+        """
+        self.import_classifier = ImportClassifier.from_linker(self.linker, cache_path)
+        return self.import_classifier
+
+    def load_coverage(self, path: Path) -> CoverageOverlay:
+        """ Join `.coverage` database onto modules, classes and functions, the result is drawn on graphs """
+        self.coverage = CoverageOverlay.load(self.linker, path)
+        return self.coverage
 
     def get_import_graph(self, path: str, width: int, height: int):
-        graph = self.import_graph.create_import_graph(width, height)
+        graph = self.import_graph.create_import_graph(
+            width, height, import_cost=self.import_cost, classifier=self.import_classifier, coverage=self.coverage
+        )
+        self.import_graph.save(graph, path)
+
+    def get_inheritance_graph(self, path: str, width: int, height: int):
+        graph = self.import_graph.create_inheritance_graph(self.hierarchy, width, height, coverage=self.coverage)
         self.import_graph.save(graph, path)
 
+    def find_dead_code(self, entries: List[str]) -> Dict[str, List]:
+        """ Objects which are unreachable from the entry modules """
+        finder = DeadCodeFinder(self.linker, self.hierarchy)
+        finder.mark(entries)
+        return finder.sweep()
+
+    def print_dead_code(self, entries: List[str]) -> int:
+        """ Prints unreachable objects grouped by kind and returns their amount """
+        report = self.find_dead_code(entries)
+
+        for kind, objects in report.items():
+            if not objects:
+                continue
+
+            print(f'Unreferenced {kind} ({len(objects)}):')
+            for name in sorted(obj.abs_import if isinstance(obj, Module) else obj.path for obj in objects):
+                print(f'  {name}')
+
+        return sum(len(objects) for objects in report.values())
+
     def print_stats(self):
         print(
             self, f'The project have {self.root.calculate_lines()} code lines', sep='\n'
         )
 
+        peak_rss = peak_rss_mb()
+        if peak_rss is not None:
+            print(f'Peak memory usage {peak_rss:.1f} MB')
+
+        if self.import_classifier is not None:
+            self.import_classifier.print_summary(self.linker.libraries)
+
     def all_variables(self) -> List[Variable]:
         """ Gather all variables in the project """
         result = []
@@ -0,0 +1,289 @@
+import hashlib
+import json
+from collections import Counter
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from src.linker import Linker
+from src.tree import Folder
+from src.utils import iter_through_files
+
+TEMPLATES_PATH = Path(__file__).parent / 'templates'
+VIS_NETWORK_CDN = 'https://unpkg.com/vis-network@9.1.2/standalone/umd/vis-network.min.js'
+
+
+@lru_cache(maxsize=1)
+def find_vis_network_js() -> Path | None:
+    """ vis-network bundled with pyvis, so the page works without network access """
+    try:
+        import pyvis
+    except ImportError:
+        return None
+
+    return next(iter(sorted(Path(pyvis.__file__).parent.glob('templates/lib/vis-*/vis-network.min.js'))), None)
+
+
+def project_fingerprint(project: Path) -> str:
+    """ Hash of the project module paths and modification times, so an added,
+        removed or edited module makes the cached graph stale. Files are not read.
+    """
+    digest = hashlib.sha1()
+    for path in sorted(iter_through_files(project, Folder.is_introspected_dir, Folder.is_module_file)):
+        digest.update(f'{path.relative_to(project)}:{path.stat().st_mtime_ns}\n'.encode('utf-8'))
+
+    return digest.hexdigest()
+
+
+class ImportGraphIndex:
+    """ Compact import graph for serving: node names with integer ids and adjacency lists.
+        Can be built from `Linker` or loaded from the cache file, so the project is not re-parsed.
+    """
+
+    def __init__(self, names: list[str], is_module: list[bool], edges: list[tuple[int, int]]):
+        self.names = names
+        self.is_module = is_module
+        self.ids = {name: node_id for node_id, name in enumerate(names)}
+
+        self.out_edges: list[list[int]] = [[] for _ in names]
+        self.in_edges: list[list[int]] = [[] for _ in names]
+        for from_id, to_id in edges:
+            self.out_edges[from_id].append(to_id)
+            self.in_edges[to_id].append(from_id)
+
+        self._groups_cache = lru_cache(maxsize=64)(self._collapse)
+
+    def __repr__(self):
+        return f'<ImportGraphIndex {len(self.names)} nodes>'
+
+    @classmethod
+    def from_linker(cls, linker: Linker) -> 'ImportGraphIndex':
+        names = list(linker)
+        is_module = [True] * len(names)
+        ids = {name: node_id for node_id, name in enumerate(names)}
+
+        edges = set()
+        for from_, to_, to_is_module in linker.iter_import_edges():
+            if to_ not in ids:
+                ids[to_] = len(names)
+                names.append(to_)
+                is_module.append(to_is_module)
+            edges.add((ids[from_], ids[to_]))
+
+        return cls(names, is_module, sorted(edges))
+
+    @classmethod
+    def load(cls, path: Path, project: Path) -> 'ImportGraphIndex | None':
+        """ Cached index of the project, None when the cache is missing, unreadable,
+            made for other project or the project modules have changed since
+        """
+        try:
+            with path.open(encoding='utf-8') as i_file:
+                data = json.load(i_file)
+        except (OSError, ValueError):
+            return None
+
+        if (
+                not isinstance(data, dict)
+                or data.get('project') != str(project.resolve())
+                or data.get('fingerprint') != project_fingerprint(project)
+        ):
+            return None
+
+        return cls(data['names'], data['is_module'], [tuple(edge) for edge in data['edges']])
+
+    def save(self, path: Path, project: Path):
+        edges = [
+            (from_id, to_id)
+            for from_id, to_ids in enumerate(self.out_edges)
+            for to_id in to_ids
+        ]
+        with path.open('w', encoding='utf-8') as o_file:
+            json.dump({
+                'project': str(project.resolve()),
+                'fingerprint': project_fingerprint(project),
+                'names': self.names,
+                'is_module': self.is_module,
+                'edges': edges,
+            }, o_file)
+
+    def _node(self, node_id: int) -> dict:
+        return {
+            'id': self.names[node_id],
+            'kind': 'module' if self.is_module[node_id] else 'library',
+            'imports': len(self.out_edges[node_id]),
+            'imported_by': len(self.in_edges[node_id]),
+        }
+
+    def search(self, query: str, limit: int = 50) -> list[dict]:
+        """ Nodes containing the query, names starting with it go first """
+        query = query.lower()
+        found = [
+            node_id for node_id, name in enumerate(self.names)
+            if query in name.lower()
+        ]
+        found.sort(key=lambda node_id: (not self.names[node_id].lower().startswith(query), self.names[node_id]))
+
+        return [self._node(node_id) for node_id in found[:limit]]
+
+    def neighbours(self, name: str, depth: int = 1, limit: int = 500) -> dict:
+        """ Nodes within `depth` import steps in both directions from the node """
+        start = self.ids[name]
+        seen = {start}
+        frontier = [start]
+        edges = set()
+
+        for _ in range(depth):
+            next_frontier = []
+            for node_id in frontier:
+                for to_id in self.out_edges[node_id]:
+                    edges.add((node_id, to_id))
+                    if to_id not in seen and len(seen) < limit:
+                        seen.add(to_id)
+                        next_frontier.append(to_id)
+                for from_id in self.in_edges[node_id]:
+                    edges.add((from_id, node_id))
+                    if from_id not in seen and len(seen) < limit:
+                        seen.add(from_id)
+                        next_frontier.append(from_id)
+            frontier = next_frontier
+
+        return {
+            'nodes': [self._node(node_id) for node_id in seen],
+            'edges': [
+                {'from': self.names[from_id], 'to': self.names[to_id], 'weight': 1}
+                for from_id, to_id in edges
+                if from_id in seen and to_id in seen
+            ],
+        }
+
+    def children(self, group: str) -> list[str]:
+        """ Package and module names one level below the group """
+        prefix = f'{group}.'
+        depth = group.count('.') + 2
+
+        return sorted({
+            '.'.join(name.split('.')[:depth])
+            for name in self.names
+            if name.startswith(prefix)
+        })
+
+    def collapse(self, groups: list[str]) -> dict:
+        """ Package-collapsed view: every node is merged into the longest listed group
+            which prefixes it (or into its top level package), edges are counted between groups
+        """
+        return self._groups_cache(frozenset(groups))
+
+    def _collapse(self, groups: frozenset[str]) -> dict:
+        node_groups = []
+        sizes = Counter()
+        for name in self.names:
+            parts = name.split('.')
+            group = parts[0]
+            for idx in range(len(parts), 0, -1):
+                if '.'.join(parts[:idx]) in groups:
+                    group = '.'.join(parts[:idx])
+                    break
+
+            node_groups.append(group)
+            sizes[group] += 1
+
+        weights = Counter()
+        for from_id, to_ids in enumerate(self.out_edges):
+            for to_id in to_ids:
+                if node_groups[from_id] != node_groups[to_id]:
+                    weights[node_groups[from_id], node_groups[to_id]] += 1
+
+        kinds = {}
+        for node_id, group in enumerate(node_groups):
+            if self.names[node_id] == group:
+                kinds[group] = 'module' if self.is_module[node_id] else 'library'
+            else:
+                # Not a node itself (`http` of `http.server`): expanded through `children`
+                kinds.setdefault(group, 'package')
+
+        return {
+            'nodes': [
+                {'id': group, 'kind': kinds[group], 'size': size}
+                for group, size in sizes.items()
+            ],
+            'edges': [
+                {'from': from_, 'to': to_, 'weight': weight}
+                for (from_, to_), weight in weights.items()
+            ],
+        }
+
+
+class GraphRequestHandler(BaseHTTPRequestHandler):
+    """ JSON API over `ImportGraphIndex` and the page which expands the graph lazily:
+        GET  /api/search?q=<text>
+        GET  /api/neighbours?node=<name>&depth=<n>
+        GET  /api/children?node=<package>
+        POST /api/collapse  {"groups": [<package>, ...]}
+    """
+    index: ImportGraphIndex
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, data, status: int = 200):
+        self._send(status, json.dumps(data).encode('utf-8'), 'application/json')
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        try:
+            if url.path == '/':
+                page = (TEMPLATES_PATH / 'serve.html').read_text(encoding='utf-8')
+                vis_url = '/static/vis-network.min.js' if find_vis_network_js() else VIS_NETWORK_CDN
+                self._send(200, page.replace('{{ vis_network_url }}', vis_url).encode('utf-8'), 'text/html')
+            elif url.path == '/static/vis-network.min.js' and find_vis_network_js():
+                self._send(200, find_vis_network_js().read_bytes(), 'application/javascript')
+            elif url.path == '/api/search':
+                self._send_json(self.index.search(query.get('q', ''), int(query.get('limit', 50))))
+            elif url.path == '/api/neighbours':
+                self._send_json(self.index.neighbours(query['node'], int(query.get('depth', 1))))
+            elif url.path == '/api/children':
+                self._send_json(self.index.children(query['node']))
+            else:
+                self._send_json({'error': f'Unknown path {url.path}'}, status=404)
+        except (KeyError, ValueError) as err:
+            self._send_json({'error': f'Bad request: {err}'}, status=400)
+
+    def do_POST(self):
+        if urlparse(self.path).path != '/api/collapse':
+            self._send_json({'error': f'Unknown path {self.path}'}, status=404)
+            return
+
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+            groups = body.get('groups', []) if isinstance(body, dict) else None
+            if not isinstance(groups, list) or not all(isinstance(group, str) for group in groups):
+                raise ValueError('groups must be a list of names')
+
+            self._send_json(self.index.collapse(groups))
+        except ValueError as err:
+            self._send_json({'error': f'Bad request: {err}'}, status=400)
+
+
+def serve(index: ImportGraphIndex, host: str = '127.0.0.1', port: int = 8000):
+    """ Run the graph server until interrupted """
+    handler = type('ProjectGraphRequestHandler', (GraphRequestHandler,), {'index': index})
+    server = ThreadingHTTPServer((host, port), handler)
+
+    print(f'Serving {index} on http://{host}:{server.server_port}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
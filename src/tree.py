@@ -1,14 +1,20 @@
 from itertools import zip_longest
 from pathlib import Path
-from typing import Iterable, Type
+from typing import Iterable
 
+from src.backends import LineBackend, ParsingBackend
 from src.code_objs.classes import Class
 from src.code_objs.functions import Function
-from src.code_objs.line import ClassLine, CodeLine, FunctionLine, ImportLine, VariableLine, parse_objects_from_file
+from src.code_objs.line import ImportLine
 from src.code_objs.variables import Variable
+from src.notebooks import NOTEBOOK_SUFFIX
+from src.utils import check_memory_limit
 
 DefinitiveObjects = Class | Function | Variable
 
+# Notebooks are modules of their code cells
+MODULE_SUFFIXES = ('.py', NOTEBOOK_SUFFIX)
+
 
 def make_relative_import(local_path, root_path):
     """ Fill `self.import_range` attribute as classic import """
@@ -34,23 +40,18 @@ class Module:
     classes: list[Class]
     functions: list[Function]
 
-    def __init__(self, path: Path, project_root: Path):
+    def __init__(self, path: Path, project_root: Path, backend: ParsingBackend | None = None):
         self.path = path
         self.abs_import = make_relative_import(path, project_root)
 
         # if path == Path('/home/sgavrilov/PycharmProjects/mi-backend-py/scheduled/executor.py'):
         #     print(123)
 
-        # Remove all empty lines
-        self.content = []
-        i_file = self.path.open(encoding='utf-8')
-        while True:
-            code_line: CodeLine = parse_objects_from_file(i_file)
-
-            if code_line is None:
-                break
+        self.backend = backend or LineBackend()
+        self.content = self.backend.read(self.path)
 
-            self.content.append(code_line)
+        self.lines_amount = len(self.content)
+        self.is_parsed = False
 
         # Module content
         self.imports = list()
@@ -74,46 +75,24 @@ class Module:
 
         raise KeyError
 
-    def parse_objects(self,
-                      container: list,
-                      parsing_line_cls: Type[ClassLine | FunctionLine],
-                      parsing_cls: Type[Class | Function]):
-        """ Parsing loop for Classes or Functions """
-        line_iter = iter(self.content)
-        end_line = None
-        while True:
-            try:
-                code_line = next(line_iter) if end_line is None else end_line
-            except StopIteration:
-                break
-
-            if isinstance(code_line, parsing_line_cls):
-                # todo: problem with parsing empty(?) class declarations
-                cls, end_line = parsing_cls.parse(code_line, line_iter, self.abs_import)
-                container.append(cls)
-            else:
-                end_line = None
-
-    def parse_global_variables(self):
-        """ Extracting global variables
-        """
-        for code_line in self.content:
-            if isinstance(code_line, VariableLine) and code_line.indent == 0:
-                self.global_variables.append(
-                    Variable(
-                        name=Variable.parse_name(code_line),
-                        module_import_path=self.abs_import,
-                        body=[code_line]
-                    )
-                )
+    def parse(self):
+        """ Extract imports, global variables, classes and functions with the parsing backend """
+        if self.is_parsed:
+            return
+
+        self.backend.parse(self)
+        self.is_parsed = True
 
-    def parse_imports(self):
-        """ Read all imported objects in the module """
+    def summarize(self):
+        """ Release the parsed lines: only imports, definitions names, kinds, line spans
+            and the lines amount are kept. Linking of imports and classes hierarchy
+            keeps working, body-based analysis (calls, references) has nothing to read.
+        """
+        self.parse()
 
-        self.imports = [
-            code_line for code_line in self.content
-            if isinstance(code_line, ImportLine)
-        ]
+        self.content = []
+        for obj in self.list_objects():
+            obj.release_body()
 
     def list_objects(self) -> list[DefinitiveObjects]:
         """ Returns all valuable objects in a list (functions, classes and globals) """
@@ -127,9 +106,22 @@ class Folder:
     """
     ignore_list = ('venv', 'versions', 'migrations')
 
-    def __init__(self, dir_path: Path, root_path: Path):
+    def __init__(self,
+                 dir_path: Path,
+                 root_path: Path,
+                 summary_only: bool = False,
+                 memory_limit: float | None = None,
+                 backend: ParsingBackend | None = None):
+        """
+        :param summary_only: reduce every module to its summary right after reading
+        :param memory_limit: peak RSS ceiling in megabytes checked after every module
+        :param backend: parsing engine shared by all the modules (line engine by default)
+        """
         self.path = dir_path
         self.root_path = root_path
+        self.summary_only = summary_only
+        self.memory_limit = memory_limit
+        self.backend = backend or LineBackend()
 
         self.import_range = ''
 
@@ -153,20 +145,45 @@ class Folder:
 
         return sum_modules + len(self.modules)
 
+    @staticmethod
+    def is_introspected_dir(path: Path) -> bool:
+        return (
+            path.is_dir()
+            and not path.name.startswith('venv')
+            and path.name[0] not in ('.', '_')
+            and path.name not in Folder.ignore_list
+        )
+
+    @staticmethod
+    def is_module_file(path: Path) -> bool:
+        """ Python files and notebooks, a notebook paired with a `.py` file of the
+            same name (jupytext) is skipped: both would have the same import path
+        """
+        if path.suffix == NOTEBOOK_SUFFIX:
+            return not path.with_suffix('.py').exists()
+
+        return path.suffix in MODULE_SUFFIXES
+
     def parse_dir(self):
         """ Extract all sub dirs into objects """
         for file in self.path.iterdir():
-            if (
-                    file.is_dir()
-                    and not file.name.startswith('venv')
-                    and file.name[0] not in ('.', '_')
-                    and file.name not in Folder.ignore_list
-            ):
-                self.sub_folders.append(Folder(dir_path=file, root_path=self.root_path))
-            elif file.suffix == '.py':
-                self.modules.append(
-                    Module(path=file, project_root=self.root_path)
+            if self.is_introspected_dir(file):
+                self.sub_folders.append(
+                    Folder(
+                        dir_path=file,
+                        root_path=self.root_path,
+                        summary_only=self.summary_only,
+                        memory_limit=self.memory_limit,
+                        backend=self.backend,
+                    )
                 )
+            elif self.is_module_file(file):
+                module = Module(path=file, project_root=self.root_path, backend=self.backend)
+                if self.summary_only:
+                    module.summarize()
+
+                self.modules.append(module)
+                check_memory_limit(self.memory_limit)
 
         for folder in self.sub_folders:
             folder.parse_dir()
@@ -174,10 +191,7 @@ class Folder:
     def parse_modules(self):
         """ Parse all import definitions """
         for module in self.modules:
-            module.parse_imports()
-            module.parse_global_variables()
-            module.parse_objects(module.classes, ClassLine, Class)
-            module.parse_objects(module.functions, FunctionLine, Function)
+            module.parse()
 
         for folder in self.sub_folders:
             folder.parse_modules()
@@ -204,7 +218,7 @@ class Folder:
     def calculate_lines(self):
         """ Calculates only code lines in modules and sub folders """
         return sum(
-            [len(module.content) for module in self.modules] +
+            [module.lines_amount for module in self.modules] +
             [
                 folder_module.calculate_lines()
                 for folder_module in self.sub_folders
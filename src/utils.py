@@ -1,6 +1,12 @@
+import sys
 from pathlib import Path
 from typing import Callable, Iterable, TypeVar
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
 FilePath = TypeVar('FilePath', bound=Path)
 FolderPath = TypeVar('FolderPath', bound=Path)
 
@@ -14,3 +20,54 @@ def iter_through_files(folder: FilePath,
             yield from iter_through_files(path, folder_filter, file_filter)
         elif path.is_file() and file_filter(path):
             yield path
+
+
+class MemoryLimitError(MemoryError):
+    """ Peak resident memory of the process went over the configured ceiling """
+
+
+def peak_rss_mb() -> float | None:
+    """ Peak resident set size of the current process in megabytes (None if unsupported) """
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS -- bytes
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def check_memory_limit(limit_mb: float | None):
+    if limit_mb is None:
+        return
+
+    peak = peak_rss_mb()
+    if peak is not None and peak > limit_mb:
+        raise MemoryLimitError(f'Peak RSS {peak:.1f} MB is over the limit of {limit_mb} MB')
+
+
+class Bitset:
+    """ Fixed size set of dense integer ids packed into bytes """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.bits = bytearray((size + 7) >> 3)
+
+    def __contains__(self, idx: int) -> bool:
+        return bool(self.bits[idx >> 3] & (1 << (idx & 7)))
+
+    def __len__(self):
+        return int.from_bytes(self.bits, 'little').bit_count()
+
+    def add(self, idx: int):
+        self.bits[idx >> 3] |= 1 << (idx & 7)
+
+    def iter_unset(self) -> Iterable[int]:
+        """ Ids which are not in the set, fully filled bytes are skipped at once """
+        for byte_idx, byte in enumerate(self.bits):
+            if byte == 0xFF:
+                continue
+
+            for bit in range(8):
+                idx = (byte_idx << 3) | bit
+                if idx < self.size and not byte & (1 << bit):
+                    yield idx
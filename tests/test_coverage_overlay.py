@@ -0,0 +1,134 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.coverage_overlay import CoverageOverlay, read_coverage_db
+from src.parser import Parser
+
+coverage = pytest.importorskip('coverage')
+
+SHAPES = '''""" Shapes """
+import math
+
+SIDES = {
+    'square': 4,
+    'triangle': 3,
+}
+
+
+class Shape:
+    """ Base shape """
+
+    def __init__(self, name):
+        self.name = name
+
+    def sides(self):
+        if self.name in SIDES:
+            return SIDES[self.name]
+        else:
+            return 0
+
+    def describe(self):
+        try:
+            return f'{self.name} with {self.sides()} sides'
+        finally:
+            pass
+
+
+def area(radius):
+    return math.pi * radius ** 2
+
+
+def unused(value):
+    for item in range(value):
+        if item:
+            print(item)
+    return value
+'''
+
+RUN = '''from pkg.shapes import Shape, area
+
+print(Shape('square').describe(), area(1))
+'''
+
+
+@pytest.fixture(scope='module', params=['line', 'branch'])
+def measured(request, tmp_path_factory) -> tuple[Path, dict]:
+    """ Project measured by coverage.py and its JSON report """
+    project = tmp_path_factory.mktemp(request.param)
+    (project / 'pkg').mkdir()
+    (project / 'pkg' / '__init__.py').write_text('')
+    (project / 'pkg' / 'shapes.py').write_text(SHAPES)
+    (project / 'run.py').write_text(RUN)
+
+    branch = ['--branch'] if request.param == 'branch' else []
+    subprocess.run([sys.executable, '-m', 'coverage', 'run', *branch, 'run.py'], cwd=project, check=True, capture_output=True)
+    subprocess.run([sys.executable, '-m', 'coverage', 'json', '-q', '-o', 'coverage.json'], cwd=project, check=True)
+
+    return project, json.loads((project / 'coverage.json').read_text())['files']
+
+
+def make_overlay(project: Path, executed: dict[str, int]) -> CoverageOverlay:
+    parser = Parser(project)
+    parser.gather_objects()
+    parser.build_link_list()
+
+    return CoverageOverlay(parser.linker, executed)
+
+
+def test_read_coverage_db_matches_coverage_data(measured):
+    project, _ = measured
+    data = coverage.CoverageData(str(project / '.coverage'))
+    data.read()
+
+    executed = read_coverage_db(project / '.coverage')
+
+    assert set(executed) == set(data.measured_files())
+    for file_path, mask in executed.items():
+        assert {lineno for lineno in range(mask.bit_length()) if mask >> lineno & 1} == set(data.lines(file_path))
+
+
+def test_modules_match_coverage_report(measured):
+    project, report = measured
+    overlay = make_overlay(project, read_coverage_db(project / '.coverage'))
+
+    assert overlay.measured_modules == len(report)
+    for file_path, file_report in report.items():
+        module_coverage = overlay.get(file_path.removesuffix('.py').replace('/', '.'))
+        summary = file_report['summary']
+        assert (module_coverage.covered, module_coverage.statements) == (summary['covered_lines'], summary['num_statements'])
+
+
+def test_functions_match_coverage_report(measured):
+    project, report = measured
+    overlay = make_overlay(project, read_coverage_db(project / '.coverage'))
+
+    functions = {name: value for name, value in report['pkg/shapes.py']['functions'].items() if name}
+    assert functions
+    for name, function_report in functions.items():
+        function_coverage = overlay.get(f'pkg.shapes.{name}')
+        summary = function_report['summary']
+        # Spans start at the `def` line, it runs on import; coverage.py regions start at the body
+        assert (function_coverage.covered - 1, function_coverage.statements - 1) == (
+            summary['covered_lines'], summary['num_statements']
+        )
+
+
+def test_other_checkout_is_joined(measured):
+    project, _ = measured
+    executed = read_coverage_db(project / '.coverage')
+    expected = make_overlay(project, executed).by_name
+
+    root = str(project.resolve())
+    moved = {file_path.replace(root, '/ci/build/checkout'): mask for file_path, mask in executed.items()}
+    # The same files measured twice and a library with the same file name as a project module
+    moved.update({file_path.replace(root, '/ci/other/checkout'): mask for file_path, mask in executed.items()})
+    moved['/usr/lib/python3/site-packages/run.py'] = (1 << 64) - 1
+
+    overlay = make_overlay(project, moved)
+
+    assert overlay.measured_modules == len(executed)
+    assert overlay.by_name == expected
@@ -0,0 +1,119 @@
+from pathlib import Path
+
+import pytest
+
+from src.backends import BACKENDS
+from src.parser import Parser
+
+PROJECT = {
+    'main.py': (
+        'from pkg.models import User\n'
+        'from pkg import helpers\n'
+        '\n'
+        '\n'
+        'def run():\n'
+        '    return helpers.greet(User())\n'
+        '\n'
+        '\n'
+        'run()\n'
+    ),
+    'pkg/__init__.py': '',
+    'pkg/models.py': (
+        'class Base:\n'
+        '    pass\n'
+        '\n'
+        '\n'
+        'class User(Base):\n'
+        '    def name(self):\n'
+        '        return "user"\n'
+        '\n'
+        '\n'
+        'class Orphan:\n'
+        '    pass\n'
+    ),
+    'pkg/helpers.py': (
+        'GREETING = "Hello"\n'
+        'UNUSED = 1\n'
+        '\n'
+        '\n'
+        'def greet(user, template=GREETING):\n'
+        '    return f"{template} {user.name()}"\n'
+        '\n'
+        '\n'
+        'def forgotten():\n'
+        '    pass\n'
+    ),
+    'pkg/legacy.py': 'def old():\n    pass\n',
+}
+
+
+def make_project(root: Path, files: dict[str, str]) -> Path:
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    return root
+
+
+def find_dead_code(project: Path, backend: str, entries: list[str]) -> dict[str, list[str]]:
+    parser = Parser(project, backend=backend)
+    parser.gather_objects()
+    parser.build_link_list()
+
+    return {
+        kind: sorted(obj.abs_import if kind == 'modules' else obj.path for obj in objects)
+        for kind, objects in parser.find_dead_code(entries).items()
+    }
+
+
+@pytest.mark.parametrize('backend', list(BACKENDS))
+def test_small_project(tmp_path: Path, backend: str):
+    project = make_project(tmp_path, PROJECT)
+
+    assert find_dead_code(project, backend, ['main.py']) == {
+        'modules': ['pkg.legacy'],
+        'classes': ['pkg.models.Orphan'],
+        'functions': ['pkg.helpers.forgotten', 'pkg.legacy.old'],
+        'variables': ['pkg.helpers.UNUSED'],
+    }
+
+
+@pytest.mark.parametrize('backend', list(BACKENDS))
+def test_import_path_entry(tmp_path: Path, backend: str):
+    project = make_project(tmp_path, PROJECT)
+
+    assert find_dead_code(project, backend, ['main', 'pkg.legacy'])['modules'] == []
+
+
+@pytest.mark.parametrize('backend', list(BACKENDS))
+def test_unknown_entry(tmp_path: Path, backend: str):
+    project = make_project(tmp_path, PROJECT)
+
+    with pytest.raises(KeyError, match='nope.py'):
+        find_dead_code(project, backend, ['nope.py'])
+
+
+@pytest.mark.parametrize('backend', list(BACKENDS))
+def test_redefined_names_are_alive_together(tmp_path: Path, backend: str):
+    project = make_project(tmp_path, {
+        'main.py': (
+            'import sys\n'
+            '\n'
+            'if sys.platform == "win32":\n'
+            '    def home():\n'
+            '        return "C:"\n'
+            'else:\n'
+            '    def home():\n'
+            '        return "/"\n'
+            '\n'
+            'DEBUG = False\n'
+            'DEBUG = True\n'
+            '\n'
+            'print(home(), DEBUG)\n'
+        ),
+    })
+
+    report = find_dead_code(project, backend, ['main.py'])
+    assert report['functions'] == []
+    assert report['variables'] == []
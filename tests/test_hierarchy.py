@@ -0,0 +1,81 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from src.parser import Parser
+
+
+def random_hierarchy(rnd: random.Random, size: int) -> dict[str, list[str]]:
+    """ Class name -> bases names, only hierarchies Python accepts are kept """
+    classes: dict[str, type] = {}
+    bases_names: dict[str, list[str]] = {}
+    for idx in range(size):
+        name = f'C{idx}'
+        bases = rnd.sample(list(classes), k=min(len(classes), rnd.randint(0, 3)))
+        try:
+            classes[name] = type(name, tuple(classes[base] for base in bases), {})
+        except TypeError:
+            # No consistent MRO
+            continue
+        bases_names[name] = bases
+
+    return bases_names
+
+
+def write_module(path: Path, hierarchy: dict[str, list[str]], imports: str = ''):
+    path.write_text(imports + ''.join(
+        f'\n\nclass {name}({", ".join(bases)}):\n    pass\n'
+        for name, bases in hierarchy.items()
+    ))
+
+
+def build_hierarchy(project: Path):
+    parser = Parser(project)
+    parser.gather_objects()
+    parser.build_link_list()
+
+    return parser.hierarchy, {class_.path: class_ for class_ in parser.hierarchy.classes}
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_mro_matches_python(tmp_path: Path, seed: int):
+    hierarchy = random_hierarchy(random.Random(seed), 60)
+    write_module(tmp_path / 'classes.py', hierarchy)
+
+    namespace = {}
+    exec((tmp_path / 'classes.py').read_text(), namespace)
+    index, by_path = build_hierarchy(tmp_path)
+
+    for name in hierarchy:
+        expected = [f'classes.{class_.__name__}' for class_ in namespace[name].__mro__[:-1]]
+        assert [class_.path for class_ in index.mro(by_path[f'classes.{name}'])] == expected
+
+        descendants = set()
+        stack = [namespace[name]]
+        while stack:
+            for subclass in stack.pop().__subclasses__():
+                descendants.add(f'classes.{subclass.__name__}')
+                stack.append(subclass)
+        assert {class_.path for class_ in index.descendants(by_path[f'classes.{name}'])} == descendants
+
+
+def test_bases_across_modules(tmp_path: Path):
+    write_module(tmp_path / 'base.py', {'Base': [], 'Mixin': []})
+    write_module(tmp_path / 'child.py', {'Child': ['Mixin', 'base.Base']}, imports='import base\nfrom base import Mixin\n')
+
+    index, by_path = build_hierarchy(tmp_path)
+
+    assert [class_.path for class_ in index.mro(by_path['child.Child'])] == ['child.Child', 'base.Mixin', 'base.Base']
+    assert index.descendants(by_path['base.Base']) == {by_path['child.Child']}
+    assert index.subclasses_of('Mixin') == {by_path['child.Child']}
+
+
+def test_deep_chain_has_no_recursion_limit(tmp_path: Path):
+    depth = 3000
+    write_module(tmp_path / 'chain.py', {f'C{idx}': [f'C{idx - 1}'] if idx else [] for idx in range(depth)})
+
+    index, by_path = build_hierarchy(tmp_path)
+
+    assert len(index.mro(by_path[f'chain.C{depth - 1}'])) == depth
+    assert len(index.descendants(by_path['chain.C0'])) == depth - 1
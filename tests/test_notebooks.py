@@ -0,0 +1,102 @@
+import ast
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from src.notebooks import iter_code_cells, iter_notebook_lines
+from src.tree import Folder
+
+# Quotes, backslashes, JSON structure characters, non-BMP and control characters
+ALPHABET = 'ab"\\\n\t{}[],: é😀\u0001'
+
+
+def random_string(rnd: random.Random) -> str:
+    return ''.join(rnd.choice(ALPHABET) for _ in range(rnd.randint(0, 30)))
+
+
+def random_notebook(rnd: random.Random) -> dict:
+    cells = []
+    for _ in range(300):
+        cell_type = rnd.choice(['code', 'markdown', 'raw'])
+        source = [random_string(rnd) for _ in range(rnd.randint(0, 4))]
+        items = [
+            ('cell_type', cell_type),
+            ('metadata', {'tags': [1, 2.5e3, None, True, {'name': random_string(rnd)}]}),
+            ('source', source if rnd.random() < 0.7 else ''.join(source)),
+        ]
+        if cell_type == 'code':
+            items += [
+                ('outputs', [{'data': {'image/png': random_string(rnd) * 50}, 'text': [random_string(rnd)]}]),
+                ('execution_count', rnd.choice([None, 3])),
+            ]
+        rnd.shuffle(items)
+        cells.append(dict(items))
+
+    return {'metadata': {'kernel': random_string(rnd)}, 'cells': cells, 'nbformat': 4}
+
+
+@pytest.mark.parametrize('seed', range(3))
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, 1 << 16])
+def test_code_cells_match_json_load(tmp_path: Path, seed: int, chunk_size: int):
+    rnd = random.Random(seed)
+    path = tmp_path / 'random.ipynb'
+    path.write_text(
+        json.dumps(random_notebook(rnd), indent=rnd.choice([None, 1]), ensure_ascii=rnd.random() < 0.5),
+        encoding='utf-8'
+    )
+
+    with path.open(encoding='utf-8') as i_file:
+        cells = json.load(i_file)['cells']
+    expected = [
+        cell['source'] if isinstance(cell['source'], str) else ''.join(cell['source'])
+        for cell in cells if cell['cell_type'] == 'code'
+    ]
+
+    assert list(iter_code_cells(path, chunk_size)) == expected
+
+
+def test_paired_notebook_is_skipped(tmp_path: Path):
+    (tmp_path / 'paired.py').write_text('x = 1\n')
+    (tmp_path / 'paired.ipynb').write_text('{"cells": []}')
+    (tmp_path / 'alone.ipynb').write_text('{"cells": []}')
+
+    assert Folder.is_module_file(tmp_path / 'paired.py')
+    assert not Folder.is_module_file(tmp_path / 'paired.ipynb')
+    assert Folder.is_module_file(tmp_path / 'alone.ipynb')
+
+
+def write_notebook(path: Path, sources: list[str]) -> Path:
+    path.write_text(json.dumps({
+        'cells': [{'cell_type': 'code', 'metadata': {}, 'outputs': [], 'source': source} for source in sources],
+        'nbformat': 4,
+    }))
+    return path
+
+
+def test_magics_are_commented_only_at_statement_start(tmp_path: Path):
+    path = write_notebook(tmp_path / 'magics.ipynb', [
+        '%matplotlib inline\n'
+        'total = (4\n'
+        '       % 3)\n'
+        'same = (1\n'
+        '      != 2)\n'
+        'text = """\n'
+        '% not a magic\n'
+        '"""\n'
+        'value = 1 + \\\n'
+        '    2\n'
+        '!pip install requests\n'
+        'items = ["(", 1 # )\n'
+        '         % 2]',
+        '%%bash\n'
+        'echo (',
+    ])
+
+    lines = list(iter_notebook_lines(path))
+
+    assert [line for line in lines if line.startswith('#')] == [
+        '# %matplotlib inline\n', '# !pip install requests\n', '# %%bash\n', '# echo (\n',
+    ]
+    ast.parse(''.join(lines))